@@ -0,0 +1,47 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True
+"""Optional Cython fast path for the stereo interleave + quantize loop.
+
+Build in place (requires Cython and a C compiler):
+
+    cythonize -i tools/_wavio.pyx
+
+For the full auto-vectorized speed let the compiler use wide SIMD:
+
+    CFLAGS="-O3 -mavx2 -ffast-math" cythonize -i tools/_wavio.pyx
+
+The WAV writers fall back to the NumPy path when this module is not
+built, so compiling it is entirely optional.
+"""
+
+from libc.math cimport lrintf
+
+import numpy as np
+
+
+def interleave_quantize(const float[::1] left, const float[::1] right):
+    """Return int16 LRLR... frames for two float32 channels.
+
+    Clamps to [-1, 1], scales to full 16-bit range and rounds to
+    nearest - the same semantics as the NumPy clip/rint path, fused
+    into one pass the C compiler can vectorize.
+    """
+    cdef Py_ssize_t n = left.shape[0]
+    out_arr = np.empty(2 * n, dtype=np.int16)
+    cdef short[::1] out = out_arr
+    cdef Py_ssize_t i
+    cdef float l, r
+    with nogil:
+        for i in range(n):
+            l = left[i] * 32767.0
+            if l > 32767.0:
+                l = 32767.0
+            elif l < -32767.0:
+                l = -32767.0
+            r = right[i] * 32767.0
+            if r > 32767.0:
+                r = 32767.0
+            elif r < -32767.0:
+                r = -32767.0
+            out[2 * i] = <short>lrintf(l)
+            out[2 * i + 1] = <short>lrintf(r)
+    return out_arr
@@ -22,14 +22,29 @@ Usage:
     python frequency-generator-pro.py --preset morning-focus --duration 900 -o focus.wav
 """
 
+from __future__ import annotations
+
 import argparse
-import numpy as np
-import wave
-import struct
+import hashlib
+import sys
+import math
 import os
 from typing import List, Tuple, Optional
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache, wraps
+
+# The numeric stack (NumPy, SciPy, optional numba/soundfile) costs a
+# few hundred ms of interpreter startup, which dominates --help/--list/
+# --research lookups. _load_engine() below imports it on first actual
+# synthesis call instead of at module import.
+
+# (bit_depth, use_float) -> libsndfile subtype
+_SF_SUBTYPES = {
+    (32, True): 'FLOAT',
+    (24, False): 'PCM_24',
+    (16, False): 'PCM_16',
+}
 
 # ============================================================================
 # RESEARCH-BACKED FREQUENCY DATABASE
@@ -158,17 +173,263 @@ QUALITY_CONFIGS = {
 }
 
 
+# Populated by _load_engine() on the first synthesis or save call
+np = None
+irfft = None
+lfilter = None
+wave = None
+sf = None
+HAVE_NUMBA = False
+HAVE_SOUNDFILE = False
+_DTYPE = None
+_RNG = None
+
+
+def _load_engine():
+    """Import the numeric stack and build the synthesis kernels.
+
+    Idempotent - the first generator or save call pays the import (and
+    optional numba compilation setup) cost; --help, --list and
+    --research never do.
+    """
+    global np, irfft, lfilter, wave, sf
+    global HAVE_NUMBA, HAVE_SOUNDFILE, _DTYPE, _RNG
+    if np is not None:
+        return
+
+    import numpy
+    import wave as _wave
+    from scipy.fft import irfft as _irfft
+    from scipy.signal import lfilter as _lfilter
+
+    np = numpy
+    wave = _wave
+    irfft = _irfft
+    lfilter = _lfilter
+
+    # Working dtype for audio buffers. float32 covers ~149 dB of
+    # dynamic range - beyond the 144 dB of the 24-bit output - at half
+    # the memory bandwidth of NumPy's default float64. Kernels still
+    # accumulate phase in double precision; only the stored samples are
+    # single precision.
+    _DTYPE = np.float32
+
+    # Shared PCG64 generator for noise - faster than the legacy global
+    # RandomState and generates float32 output directly. Reseedable via
+    # the --seed CLI flag for reproducible renders.
+    _RNG = np.random.default_rng()
+
+    # soundfile (libsndfile) is optional - it writes whole blocks in
+    # one C call and supports true 32-bit float WAV for pro quality;
+    # the wave module path remains the fallback
+    try:
+        import soundfile as _sf
+        sf = _sf
+        HAVE_SOUNDFILE = True
+    except ImportError:
+        HAVE_SOUNDFILE = False
+
+    # Numba is optional - when present, the hot synthesis kernels run
+    # as parallel SIMD machine code; without it everything falls back
+    # to NumPy
+    try:
+        from numba import njit, prange
+        HAVE_NUMBA = True
+    except ImportError:
+        HAVE_NUMBA = False
+        return
+
+    global _sine_kernel, _harmonics_kernel, _binaural_kernel
+    global _scale_kernel, _brown_kernel, _isochronic_kernel
+
+    @njit(parallel=True, fastmath=True)
+    def _sine_kernel(freq, duration, amplitude, out):
+        n = out.shape[0]
+        dt = duration / n
+        w = 2.0 * math.pi * freq
+        for i in prange(n):
+            out[i] = amplitude * math.sin(w * i * dt)
+
+    @njit(parallel=True, fastmath=True)
+    def _harmonics_kernel(freq, duration, ks, amps, out):
+        # Sum all partials per sample in one streaming pass so the
+        # output buffer is touched exactly once
+        n = out.shape[0]
+        dt = duration / n
+        w = 2.0 * math.pi * freq
+        for i in prange(n):
+            p = w * i * dt
+            s = 0.0
+            for j in range(ks.shape[0]):
+                s += amps[j] * math.sin(ks[j] * p)
+            out[i] = s
+
+    @njit(parallel=True, fastmath=True)
+    def _binaural_kernel(left_freq, right_freq, duration, ks, amps, left, right):
+        # Both ears share the same time axis and partial table, so one
+        # pass fills the two channels together
+        n = left.shape[0]
+        dt = duration / n
+        wl = 2.0 * math.pi * left_freq
+        wr = 2.0 * math.pi * right_freq
+        for i in prange(n):
+            t = i * dt
+            sl = 0.0
+            sr = 0.0
+            for j in range(ks.shape[0]):
+                sl += amps[j] * math.sin(ks[j] * wl * t)
+                sr += amps[j] * math.sin(ks[j] * wr * t)
+            left[i] = sl
+            right[i] = sr
+
+    @njit(parallel=True, fastmath=True)
+    def _scale_kernel(audio, scale):
+        for i in prange(audio.shape[0]):
+            audio[i] *= scale
+
+    @njit(fastmath=True)
+    def _brown_kernel(white, out):
+        # Running integration and peak scan fused into one pass;
+        # returns the max-abs so the caller can normalize
+        s = 0.0
+        m = 0.0
+        for i in range(white.shape[0]):
+            s += white[i]
+            out[i] = s
+            a = abs(s)
+            if a > m:
+                m = a
+        return m
+
+    @njit(parallel=True, fastmath=True)
+    def _isochronic_kernel(freq, pulse_rate, duration, out):
+        n = out.shape[0]
+        dt = duration / n
+        wc = 2.0 * math.pi * freq
+        wp = 2.0 * math.pi * pulse_rate
+        for i in prange(n):
+            t = i * dt
+            out[i] = math.sin(wc * t) * (0.5 * (1.0 + math.cos(wp * t)))
+
+
 def db_to_amplitude(db: float) -> float:
     """Convert dB to linear amplitude."""
     return 10 ** (db / 20)
 
 
+# On-disk cache for deterministic generator output - rerunning a preset
+# regenerates byte-identical tones, so repeated sessions become a
+# memory-mapped read instead of a full synthesis pass
+_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "vibe-os", "audio")
+
+
+def disk_cache(func):
+    """Memoize a deterministic generator's output as .npy on disk.
+
+    Keyed on function name, arguments and working dtype. Hits are
+    loaded with mmap_mode='r' so the cached render streams from disk
+    into the block writer without a full in-memory copy. Any cache IO
+    failure silently falls back to computing.
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        _load_engine()
+        key = hashlib.blake2b(repr(
+            (func.__name__, args, tuple(sorted(kwargs.items())), np.dtype(_DTYPE).name)
+        ).encode()).hexdigest()[:16]
+        path = os.path.join(_CACHE_DIR, f"{key}.npy")
+        try:
+            if os.path.exists(path):
+                cached = np.load(path, mmap_mode='r')
+                # stereo results are stored as one stacked (2, n) array
+                return (cached[0], cached[1]) if cached.ndim == 2 else cached
+        except (OSError, ValueError):
+            pass
+        result = func(*args, **kwargs)
+        try:
+            os.makedirs(_CACHE_DIR, exist_ok=True)
+            np.save(path, np.stack(result) if isinstance(result, tuple) else result)
+        except OSError:
+            pass
+        return result
+    return wrapper
+
+
+def _phase(freq: float, n: int, sample_rate: int) -> np.ndarray:
+    """Build the phase array 2*pi*f*i/sr directly.
+
+    Skips materializing a separate time axis just to multiply it by
+    2*pi*f afterwards - one allocation and one pass instead of two.
+    """
+    return np.arange(n, dtype=np.float64) * (2.0 * np.pi * freq / sample_rate)
+
+
+# Above this many samples, two FFT passes are cheaper than evaluating
+# libm sin per element, so long pure tones switch to spectral synthesis
+_FFT_SYNTH_MIN_SAMPLES = 1 << 24
+
+
+def generate_sine_fft(freq: float, duration: float, sample_rate: int,
+                      amplitude: float = 1.0) -> np.ndarray:
+    """Synthesize a pure tone as a single spectral line via inverse FFT.
+
+    Spectrally exact when freq*N/sr lands on an integer bin - the
+    caller is responsible for checking that before dispatching here.
+    """
+    _load_engine()
+    n = int(sample_rate * duration)
+    k = round(freq * n / sample_rate)
+    spec = np.zeros(n // 2 + 1, dtype=np.complex64)
+    # irfft of -i*(N/2)*a at bin k is exactly a*sin(2*pi*k*i/N)
+    spec[k] = -1j * amplitude * (n / 2)
+    return irfft(spec, n=n, workers=-1)
+
+
+@disk_cache
 def generate_sine(freq: float, duration: float, sample_rate: int, amplitude: float = 1.0) -> np.ndarray:
     """Generate pure sine wave."""
-    t = np.linspace(0, duration, int(sample_rate * duration), False)
-    return amplitude * np.sin(2 * np.pi * freq * t)
+    n = int(sample_rate * duration)
+    bin_pos = freq * n / sample_rate
+    if n > _FFT_SYNTH_MIN_SAMPLES and abs(bin_pos - round(bin_pos)) < 1e-9:
+        return generate_sine_fft(freq, duration, sample_rate, amplitude)
+    if HAVE_NUMBA:
+        out = np.empty(n, dtype=_DTYPE)
+        _sine_kernel(freq, duration, amplitude, out)
+        return out
+    return (amplitude * np.sin(_phase(freq, n, sample_rate))).astype(_DTYPE, copy=False)
+
+
+# Partials above the fundamental per profile, as (harmonic, amplitude):
+# - warm: even harmonics emphasized (pleasing, musical)
+# - bright: odd harmonics emphasized (cutting, clear)
+# - natural: decaying harmonics (like acoustic instruments)
+HARMONIC_PROFILES = {
+    "warm": ((2, 0.5), (4, 0.25), (6, 0.125)),
+    "bright": ((3, 0.33), (5, 0.2), (7, 0.14)),
+    "natural": tuple((i, 1.0 / (i ** 1.5)) for i in range(2, 9)),
+}
+
+
+@lru_cache(maxsize=None)
+def _analytic_peak_harmonic(harmonic_profile: str) -> float:
+    """True peak of a harmonic stack, from one dense period evaluation.
+
+    Every partial is an integer multiple of the fundamental, so the
+    stacked waveform repeats each fundamental period regardless of
+    frequency, duration or sample rate. Evaluating one period on a
+    4096-point grid gives the exact peak (1.151 for "warm", far below
+    the 1.875 amplitude-sum bound), cached per profile - normalization
+    hits target_db exactly while still skipping the full-buffer scan.
+    """
+    _load_engine()
+    x = np.arange(4096) * (2.0 * math.pi / 4096)
+    wave = np.sin(x)
+    for k, a in HARMONIC_PROFILES.get(harmonic_profile, ()):
+        wave += a * np.sin(k * x)
+    return float(np.abs(wave, out=wave).max())
 
 
+@disk_cache
 def generate_with_harmonics(freq: float, duration: float, sample_rate: int,
                            harmonic_profile: str = "warm") -> np.ndarray:
     """
@@ -179,61 +440,88 @@ def generate_with_harmonics(freq: float, duration: float, sample_rate: int,
     - bright: Odd harmonics emphasized (cutting, clear)
     - natural: Decaying harmonics (like acoustic instruments)
     """
-    t = np.linspace(0, duration, int(sample_rate * duration), False)
-
-    # Fundamental
-    wave = np.sin(2 * np.pi * freq * t)
+    n = int(sample_rate * duration)
+
+    harmonics = HARMONIC_PROFILES.get(harmonic_profile, ())
+
+    ks = np.array([1.0] + [k for k, _ in harmonics])
+    amps = np.array([1.0] + [a for _, a in harmonics])
+
+    if HAVE_NUMBA:
+        # Fused kernel: all partials accumulated per sample, one
+        # streaming write to the output instead of one pass per harmonic
+        out = np.empty(n, dtype=_DTYPE)
+        _harmonics_kernel(freq, duration, ks, amps, out)
+        return out
+
+    # NumPy fallback: evaluate sin over a (K, block) matrix and reduce
+    # the partials with one amps @ M product - a single large ufunc
+    # call plus a BLAS reduction instead of one pass per harmonic.
+    # Tiled so the matrix temporary stays bounded for long renders.
+    phase = _phase(freq, n, sample_rate)
+    wave = np.empty(n, dtype=_DTYPE)
+    tile = 1 << 20
+    for start in range(0, n, tile):
+        seg = phase[start:start + tile]
+        wave[start:start + tile] = amps @ np.sin(np.multiply.outer(ks, seg))
 
-    if harmonic_profile == "warm":
-        # Even harmonics (2nd, 4th, 6th) - warm, pleasing
-        wave += 0.5 * np.sin(2 * np.pi * (freq * 2) * t)   # 2nd harmonic
-        wave += 0.25 * np.sin(2 * np.pi * (freq * 4) * t)  # 4th harmonic
-        wave += 0.125 * np.sin(2 * np.pi * (freq * 6) * t) # 6th harmonic
+    return wave
 
-    elif harmonic_profile == "bright":
-        # Odd harmonics (3rd, 5th, 7th) - brighter, more present
-        wave += 0.33 * np.sin(2 * np.pi * (freq * 3) * t)  # 3rd harmonic
-        wave += 0.2 * np.sin(2 * np.pi * (freq * 5) * t)   # 5th harmonic
-        wave += 0.14 * np.sin(2 * np.pi * (freq * 7) * t)  # 7th harmonic
 
-    elif harmonic_profile == "natural":
-        # Natural decay like acoustic instruments
-        for i in range(2, 9):
-            amplitude = 1.0 / (i ** 1.5)  # Natural rolloff
-            wave += amplitude * np.sin(2 * np.pi * (freq * i) * t)
+def _pink_voss(samples: int, nrows: int = 16) -> np.ndarray:
+    """Voss-McCartney pink noise: stacked white generators, each held
+    for 2**k samples, summed - a true -3 dB/octave spectrum built from
+    nrows vectorized repeats."""
+    total = np.zeros(samples, dtype=_DTYPE)
+    for k in range(nrows):
+        step = 1 << k
+        values = _RNG.standard_normal(samples // step + 1, dtype=_DTYPE)
+        total += np.repeat(values, step)[:samples]
+    return total
 
-    return wave
 
+def generate_pink_noise(duration: float, sample_rate: int,
+                        algorithm: str = "kellet") -> np.ndarray:
+    """Generate pink noise (1/f noise) - more natural, less harsh than white.
 
-def generate_pink_noise(duration: float, sample_rate: int) -> np.ndarray:
-    """Generate pink noise (1/f noise) - more natural, less harsh than white."""
+    Algorithms:
+    - kellet: Paul Kellet IIR approximation (fast, very close to 1/f)
+    - voss: Voss-McCartney multi-rate sum (exact -3 dB/octave slope)
+    """
+    _load_engine()
     samples = int(sample_rate * duration)
 
-    # Generate white noise
-    white = np.random.randn(samples)
+    if algorithm == "voss":
+        pink = _pink_voss(samples)
+    else:
+        # Generate white noise
+        white = _RNG.standard_normal(samples, dtype=_DTYPE)
 
-    # Apply 1/f filter using cumulative sum method (simplified pink noise)
-    # More accurate: use Voss-McCartney algorithm
-    b = [0.049922035, -0.095993537, 0.050612699, -0.004408786]
-    a = [1, -2.494956002, 2.017265875, -0.522189400]
+        # Apply 1/f filter (Paul Kellet coefficients) - runs as a single
+        # C-level IIR pass instead of a per-sample Python loop
+        b = np.array([0.049922035, -0.095993537, 0.050612699, -0.004408786], dtype=_DTYPE)
+        a = np.array([1, -2.494956002, 2.017265875, -0.522189400], dtype=_DTYPE)
 
-    # Simple approximation using rolling average
-    pink = np.zeros(samples)
-    pink[0] = white[0]
-    for i in range(1, samples):
-        pink[i] = 0.99 * pink[i-1] + white[i]
+        pink = lfilter(b, a, white)
 
     return pink / np.max(np.abs(pink))
 
 
 def generate_brown_noise(duration: float, sample_rate: int) -> np.ndarray:
     """Generate brown/red noise - even deeper, rumbling."""
+    _load_engine()
     samples = int(sample_rate * duration)
-    white = np.random.randn(samples)
+    white = _RNG.standard_normal(samples, dtype=_DTYPE)
+    if HAVE_NUMBA:
+        brown = np.empty(samples, dtype=_DTYPE)
+        peak = _brown_kernel(white, brown)
+        brown *= 1.0 / peak
+        return brown
     brown = np.cumsum(white)
     return brown / np.max(np.abs(brown))
 
 
+@disk_cache
 def generate_binaural(base_freq: float, beat_freq: float, duration: float,
                       sample_rate: int, harmonics: bool = False) -> Tuple[np.ndarray, np.ndarray]:
     """
@@ -246,6 +534,18 @@ def generate_binaural(base_freq: float, beat_freq: float, duration: float,
     left_freq = base_freq
     right_freq = base_freq + beat_freq
 
+    if HAVE_NUMBA:
+        # Fused kernel fills both channels from one shared time axis,
+        # halving the per-channel setup and sin passes
+        partials = HARMONIC_PROFILES["warm"] if harmonics else ()
+        ks = np.array([1.0] + [k for k, _ in partials])
+        amps = np.array([1.0] + [a for _, a in partials])
+        n = int(sample_rate * duration)
+        left = np.empty(n, dtype=_DTYPE)
+        right = np.empty(n, dtype=_DTYPE)
+        _binaural_kernel(left_freq, right_freq, duration, ks, amps, left, right)
+        return left, right
+
     if harmonics:
         left = generate_with_harmonics(left_freq, duration, sample_rate, "warm")
         right = generate_with_harmonics(right_freq, duration, sample_rate, "warm")
@@ -262,19 +562,42 @@ def generate_isochronic(freq: float, pulse_rate: float, duration: float,
     Generate isochronic tones - single pulsing tone.
     More effective than binaural for some people, doesn't require headphones.
     """
-    t = np.linspace(0, duration, int(sample_rate * duration), False)
-    carrier = np.sin(2 * np.pi * freq * t)
+    _load_engine()
+    n = int(sample_rate * duration)
+    if HAVE_NUMBA:
+        # Fused carrier * raised-cosine envelope in one streaming pass
+        out = np.empty(n, dtype=_DTYPE)
+        _isochronic_kernel(freq, pulse_rate, duration, out)
+        return out
+
+    carrier = np.sin(_phase(freq, n, sample_rate))
 
     # Create smooth pulse envelope (raised cosine for less harsh transitions)
-    pulse_period = 1.0 / pulse_rate
-    pulse = 0.5 * (1 + np.cos(2 * np.pi * pulse_rate * t))
+    pulse = 0.5 * (1 + np.cos(_phase(pulse_rate, n, sample_rate)))
 
-    return carrier * pulse
+    return (carrier * pulse).astype(_DTYPE, copy=False)
+
+
+@lru_cache(maxsize=8)
+def _fade_curves(attack_samples: int, release_samples: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Cached raised-cosine fade pair - presets reuse identical sizes."""
+    # Smooth raised cosine fade (less abrupt than linear)
+    fade_in = 0.5 * (1 - np.cos(np.linspace(0, np.pi, attack_samples)))
+    fade_out = 0.5 * (1 + np.cos(np.linspace(0, np.pi, release_samples)))
+    fade_in.flags.writeable = False
+    fade_out.flags.writeable = False
+    return fade_in, fade_out
 
 
 def apply_envelope(audio: np.ndarray, attack: float = 2.0, release: float = 2.0,
-                   sample_rate: int = 44100) -> np.ndarray:
-    """Apply ADSR-style envelope with smooth fade in/out."""
+                   sample_rate: int = 44100, inplace: bool = False) -> np.ndarray:
+    """Apply ADSR-style envelope with smooth fade in/out.
+
+    inplace=True mutates the caller's buffer directly, skipping the
+    full-length defensive copy - safe whenever the caller owns a
+    freshly-generated render.
+    """
+    _load_engine()
     attack_samples = int(attack * sample_rate)
     release_samples = int(release * sample_rate)
 
@@ -282,134 +605,208 @@ def apply_envelope(audio: np.ndarray, attack: float = 2.0, release: float = 2.0,
     attack_samples = min(attack_samples, len(audio) // 4)
     release_samples = min(release_samples, len(audio) // 4)
 
-    # Smooth raised cosine fade (less abrupt than linear)
-    fade_in = 0.5 * (1 - np.cos(np.linspace(0, np.pi, attack_samples)))
-    fade_out = 0.5 * (1 + np.cos(np.linspace(0, np.pi, release_samples)))
+    fade_in, fade_out = _fade_curves(attack_samples, release_samples)
 
-    audio = audio.copy()
+    if not inplace:
+        audio = audio.copy()
     audio[:attack_samples] *= fade_in
     audio[-release_samples:] *= fade_out
 
     return audio
 
 
-def normalize(audio: np.ndarray, target_db: float = -0.1) -> np.ndarray:
-    """Normalize audio to target dB level (maximize loudness safely)."""
-    peak = np.max(np.abs(audio))
+def normalize(audio: np.ndarray, target_db: float = -0.1,
+              known_peak: Optional[float] = None) -> np.ndarray:
+    """Normalize audio in place to target dB level (maximize loudness safely).
+
+    The scale is computed once (from known_peak when given, else a
+    single scan) and applied with an in-place multiply - no second
+    full-length allocation.
+    """
+    _load_engine()
+    peak = known_peak if known_peak is not None else np.max(np.abs(audio))
     if peak > 0:
-        target_amp = db_to_amplitude(target_db)
-        audio = audio * (target_amp / peak)
+        scale = db_to_amplitude(target_db) / peak
+        if HAVE_NUMBA:
+            _scale_kernel(audio, scale)
+        else:
+            audio *= scale
     return audio
 
 
+def _pack_24bit(audio_int: np.ndarray) -> bytes:
+    """Pack int32 samples into little-endian 24-bit PCM bytes.
+
+    Views the int32 buffer as bytes and drops the sign-extension byte,
+    turning per-sample struct.pack calls into one contiguous copy.
+    """
+    a = np.ascontiguousarray(audio_int.astype('<i4', copy=False))
+    return a.view(np.uint8).reshape(-1, 4)[:, :3].tobytes()
+
+
+# Block size for streamed WAV writes - large enough to amortize call
+# overhead, small enough to stay cache-resident through scale/fade/pack
+_BLOCK_SAMPLES = 1 << 16
+
+
+def render_blocks(audio: np.ndarray, block_size: int = _BLOCK_SAMPLES):
+    """Yield (offset, view) pairs over audio in fixed-size blocks."""
+    for start in range(0, len(audio), block_size):
+        yield start, audio[start:start + block_size]
+
+
+def _apply_block_fades(block: np.ndarray, start: int, total: int,
+                       fade_in: np.ndarray, fade_out: np.ndarray):
+    """Apply the slice of the fade envelopes that overlaps this block."""
+    end = start + len(block)
+    attack = len(fade_in)
+    if start < attack:
+        hi = min(end, attack)
+        block[:hi - start] *= fade_in[start:hi]
+    release_start = total - len(fade_out)
+    if end > release_start:
+        lo = max(start, release_start)
+        block[lo - start:] *= fade_out[lo - release_start:end - release_start]
+
+
 def save_wav(audio: np.ndarray, filename: str, config: AudioConfig, stereo: bool = False,
-             left: Optional[np.ndarray] = None, right: Optional[np.ndarray] = None):
-    """Save audio with specified quality settings."""
+             left: Optional[np.ndarray] = None, right: Optional[np.ndarray] = None,
+             known_peak: Optional[float] = None):
+    """Save audio with specified quality settings.
+
+    The render is processed in fixed-size blocks: normalization scale,
+    envelope (only where it overlaps), clip, quantize and pack happen
+    per block, each streamed straight into the WAV writer. Peak memory
+    stays at one block per channel instead of full-length int and
+    packed copies of the whole render.
+
+    known_peak, when given, skips the full-buffer peak scan. It may be
+    exact (e.g. the amplitude of a pure sine) or a safe upper bound
+    (e.g. the summed partial amplitudes of a harmonic stack); a bound
+    lands the render below target_db, so the stats footer reports the
+    peak actually measured while streaming the blocks out.
+    """
+    _load_engine()
 
     if stereo and left is not None and right is not None:
-        # Process stereo
-        left = apply_envelope(left, sample_rate=config.sample_rate)
-        right = apply_envelope(right, sample_rate=config.sample_rate)
-        left = normalize(left, config.target_db)
-        right = normalize(right, config.target_db)
-        channels = 2
+        channels = (left, right)
     else:
-        # Process mono
-        audio = apply_envelope(audio, sample_rate=config.sample_rate)
-        audio = normalize(audio, config.target_db)
-        channels = 1
-
-    with wave.open(filename, 'w') as wav_file:
-        wav_file.setnchannels(channels)
-
-        if config.use_float:
-            # 32-bit float - save as 24-bit PCM (wave doesn't support float directly)
-            wav_file.setsampwidth(3)  # 24-bit
-            if stereo:
-                left_int = (np.clip(left, -1, 1) * 8388607).astype(np.int32)
-                right_int = (np.clip(right, -1, 1) * 8388607).astype(np.int32)
-                stereo_data = np.empty(left_int.size * 2, dtype=np.int32)
-                stereo_data[0::2] = left_int
-                stereo_data[1::2] = right_int
-                # Pack as 24-bit
-                packed = b''.join(struct.pack('<i', s)[0:3] for s in stereo_data)
+        channels = (audio,)
+
+    sample_rate = config.sample_rate
+    total = len(channels[0])
+
+    # Analytic peak where known, otherwise one scan per channel; the
+    # scale is then folded into the per-block multiply below
+    target_amp = db_to_amplitude(config.target_db)
+    scales = []
+    for ch in channels:
+        peak = known_peak if known_peak is not None else np.max(np.abs(ch))
+        scales.append(target_amp / peak if peak > 0 else 1.0)
+
+    # Smooth raised cosine fades, sliced per block as needed
+    attack_samples = min(int(2.0 * sample_rate), total // 4)
+    release_samples = min(int(2.0 * sample_rate), total // 4)
+    fade_in, fade_out = _fade_curves(attack_samples, release_samples)
+
+    # Measured output peak, accumulated per block below - the blocks
+    # are already in cache, so this costs two reductions per block
+    out_peak = 0.0
+
+    def processed_blocks():
+        """Scaled, faded, clipped float frames - (N, 2) for stereo."""
+        nonlocal out_peak
+        for start, _ in render_blocks(channels[0]):
+            blocks = []
+            for ch, scale in zip(channels, scales):
+                block = ch[start:start + _BLOCK_SAMPLES] * scale
+                _apply_block_fades(block, start, total, fade_in, fade_out)
+                np.clip(block, -1, 1, out=block)
+                out_peak = max(out_peak, float(block.max()), -float(block.min()))
+                blocks.append(block)
+
+            if len(blocks) == 2:
+                # Column assignment interleaves with contiguous writes
+                # instead of two strided passes
+                frames = np.empty((blocks[0].size, 2), dtype=blocks[0].dtype)
+                frames[:, 0] = blocks[0]
+                frames[:, 1] = blocks[1]
             else:
-                audio_int = (np.clip(audio, -1, 1) * 8388607).astype(np.int32)
-                packed = b''.join(struct.pack('<i', s)[0:3] for s in audio_int)
-            wav_file.setframerate(config.sample_rate)
-            wav_file.writeframes(packed)
+                frames = blocks[0]
+            yield frames
+
+    subtype = _SF_SUBTYPES.get((config.bit_depth, config.use_float))
+    if HAVE_SOUNDFILE and subtype is not None:
+        # libsndfile converts and writes each block in one C call, and
+        # supports true 32-bit float WAV for pro quality
+        with sf.SoundFile(filename, 'w', samplerate=sample_rate,
+                          channels=len(channels), subtype=subtype,
+                          format='WAV') as out_file:
+            for frames in processed_blocks():
+                out_file.write(frames)
+    else:
+        if config.use_float or config.bit_depth == 24:
+            # 32-bit float is saved as 24-bit PCM (wave doesn't support float)
+            sampwidth, max_val = 3, 8388607
         else:
-            if config.bit_depth == 24:
-                wav_file.setsampwidth(3)
-                max_val = 8388607
-            else:
-                wav_file.setsampwidth(2)
-                max_val = 32767
-
-            wav_file.setframerate(config.sample_rate)
-
-            if stereo:
-                left_int = (np.clip(left, -1, 1) * max_val).astype(np.int32)
-                right_int = (np.clip(right, -1, 1) * max_val).astype(np.int32)
-                if config.bit_depth == 24:
-                    stereo_data = np.empty(left_int.size * 2, dtype=np.int32)
-                    stereo_data[0::2] = left_int
-                    stereo_data[1::2] = right_int
-                    packed = b''.join(struct.pack('<i', s)[0:3] for s in stereo_data)
-                    wav_file.writeframes(packed)
-                else:
-                    stereo_data = np.empty(left_int.size * 2, dtype=np.int16)
-                    stereo_data[0::2] = left_int.astype(np.int16)
-                    stereo_data[1::2] = right_int.astype(np.int16)
-                    wav_file.writeframes(stereo_data.tobytes())
-            else:
-                if config.bit_depth == 24:
-                    audio_int = (np.clip(audio, -1, 1) * max_val).astype(np.int32)
-                    packed = b''.join(struct.pack('<i', s)[0:3] for s in audio_int)
-                    wav_file.writeframes(packed)
+            sampwidth, max_val = 2, 32767
+
+        with wave.open(filename, 'w') as wav_file:
+            wav_file.setnchannels(len(channels))
+            wav_file.setsampwidth(sampwidth)
+            wav_file.setframerate(sample_rate)
+
+            for frames in processed_blocks():
+                if frames.ndim == 2:
+                    frames = frames.ravel()
+                if sampwidth == 3:
+                    wav_file.writeframes(_pack_24bit((frames * max_val).astype(np.int32)))
                 else:
-                    audio_int = (np.clip(audio, -1, 1) * max_val).astype(np.int16)
-                    wav_file.writeframes(audio_int.tobytes())
+                    wav_file.writeframes(((frames * max_val).astype(np.int16)).tobytes())
 
     # Calculate file stats
     file_size = os.path.getsize(filename)
     print(f"Saved: {filename}")
     print(f"  Quality: {config.sample_rate} Hz, {config.bit_depth}-bit")
     print(f"  Size: {file_size / 1024 / 1024:.2f} MB")
-    print(f"  Peak level: {config.target_db} dBFS (maximized)")
+    if out_peak > 0:
+        print(f"  Peak level: {20 * math.log10(out_peak):.2f} dBFS (measured)")
+    else:
+        print("  Peak level: -inf dBFS (silence)")
 
 
 def print_research_info():
     """Print research-backed frequency information."""
-    print("\n" + "="*70)
-    print("EVIDENCE-BASED FREQUENCY GUIDE")
-    print("="*70)
+    # Accumulate once and flush with a single write - dozens of
+    # individual print calls each lock and flush stdio
+    lines = ["", "="*70, "EVIDENCE-BASED FREQUENCY GUIDE", "="*70]
 
-    print("\n### STRONGLY SUPPORTED BY RESEARCH ###\n")
+    lines.append("\n### STRONGLY SUPPORTED BY RESEARCH ###\n")
     for freq, info in EVIDENCE_BASED.items():
-        print(f"  {freq:>4} Hz - {info['name']}")
-        print(f"         Effect: {info['effect']}")
-        print(f"         Evidence: {info['evidence']}")
-        print()
+        lines.append(f"  {freq:>4} Hz - {info['name']}")
+        lines.append(f"         Effect: {info['effect']}")
+        lines.append(f"         Evidence: {info['evidence']}")
+        lines.append("")
 
-    print("\n### SOLFEGGIO FREQUENCIES (Limited Scientific Evidence) ###\n")
+    lines.append("\n### SOLFEGGIO FREQUENCIES (Limited Scientific Evidence) ###\n")
     for freq, info in SOLFEGGIO.items():
-        evidence_marker = "*" if info['evidence'] != "Anecdotal" else " "
-        print(f"  {freq:>4} Hz - {info['name']:12} | {info['effect']}")
-    print("\n  * Has preliminary research support")
+        lines.append(f"  {freq:>4} Hz - {info['name']:12} | {info['effect']}")
+    lines.append("\n  * Has preliminary research support")
 
-    print("\n### BRAINWAVE ENTRAINMENT (Strong Research Support) ###\n")
+    lines.append("\n### BRAINWAVE ENTRAINMENT (Strong Research Support) ###\n")
     for state, info in BRAINWAVE_PRESETS.items():
-        print(f"  {state.upper():6} ({info['range'][0]}-{info['range'][1]} Hz)")
-        print(f"         Optimal: {info['optimal']} Hz beat | Carrier: {info['carrier']} Hz")
-        print(f"         Effect: {info['effect']}")
-        print()
+        lines.append(f"  {state.upper():6} ({info['range'][0]}-{info['range'][1]} Hz)")
+        lines.append(f"         Optimal: {info['optimal']} Hz beat | Carrier: {info['carrier']} Hz")
+        lines.append(f"         Effect: {info['effect']}")
+        lines.append("")
+
+    lines.append("\n### RESEARCH SOURCES ###")
+    lines.append("  - Binaural beats: https://pmc.ncbi.nlm.nih.gov/articles/PMC10198548/")
+    lines.append("  - 432 Hz health: https://pubmed.ncbi.nlm.nih.gov/31031095/")
+    lines.append("  - 528 Hz study: https://www.scirp.org/journal/paperinformation?paperid=87146")
+    lines.append("  - Gamma/attention: https://www.nature.com/articles/s41598-025-88517-z")
 
-    print("\n### RESEARCH SOURCES ###")
-    print("  - Binaural beats: https://pmc.ncbi.nlm.nih.gov/articles/PMC10198548/")
-    print("  - 432 Hz health: https://pubmed.ncbi.nlm.nih.gov/31031095/")
-    print("  - 528 Hz study: https://www.scirp.org/journal/paperinformation?paperid=87146")
-    print("  - Gamma/attention: https://www.nature.com/articles/s41598-025-88517-z")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
@@ -459,6 +856,10 @@ Examples:
                         default="none", help="Layer background noise")
     parser.add_argument("--noise-level", type=float, default=0.1,
                         help="Noise mix level 0-1 (default: 0.1)")
+    parser.add_argument("--noise-algo", choices=["kellet", "voss"], default="kellet",
+                        help="Pink noise algorithm (default: kellet IIR)")
+    parser.add_argument("--seed", type=int,
+                        help="Seed the noise generator for reproducible renders")
 
     parser.add_argument("--research", "-r", action="store_true",
                         help="Show research-backed frequency information")
@@ -472,17 +873,26 @@ Examples:
         return
 
     if args.list:
-        print("\n=== SESSION PRESETS ===")
+        lines = ["\n=== SESSION PRESETS ==="]
         for name, preset in SESSION_PRESETS.items():
-            print(f"  {name:20} - {preset['description']}")
-        print("\n=== BRAINWAVE STATES ===")
+            lines.append(f"  {name:20} - {preset['description']}")
+        lines.append("\n=== BRAINWAVE STATES ===")
         for state, info in BRAINWAVE_PRESETS.items():
-            print(f"  {state:8} - {info['effect']}")
-        print("\n=== SOLFEGGIO FREQUENCIES ===")
+            lines.append(f"  {state:8} - {info['effect']}")
+        lines.append("\n=== SOLFEGGIO FREQUENCIES ===")
         for freq, info in SOLFEGGIO.items():
-            print(f"  {freq:4} Hz - {info['name']}: {info['effect']}")
+            lines.append(f"  {freq:4} Hz - {info['name']}: {info['effect']}")
+        sys.stdout.write("\n".join(lines) + "\n")
         return
 
+    # Everything past this point synthesizes audio - load the numeric
+    # stack now so --seed can reseed the shared generator
+    _load_engine()
+
+    if args.seed is not None:
+        global _RNG
+        _RNG = np.random.default_rng(args.seed)
+
     # Get quality config
     quality = AudioQuality(args.quality)
     config = QUALITY_CONFIGS[quality]
@@ -500,7 +910,9 @@ Examples:
                 preset["carrier"], preset["beat"], duration,
                 config.sample_rate, preset.get("harmonics", False)
             )
-            save_wav(None, args.output, config, stereo=True, left=left, right=right)
+            peak = _analytic_peak_harmonic("warm") if preset.get("harmonics") else 1.0
+            save_wav(None, args.output, config, stereo=True, left=left, right=right,
+                     known_peak=peak)
 
         elif preset["type"] == "layered":
             # Generate base frequency
@@ -532,7 +944,9 @@ Examples:
             preset["carrier"], preset["optimal"], args.duration,
             config.sample_rate, use_harmonics
         )
-        save_wav(None, args.output, config, stereo=True, left=left, right=right)
+        peak = _analytic_peak_harmonic("warm") if use_harmonics else 1.0
+        save_wav(None, args.output, config, stereo=True, left=left, right=right,
+                 known_peak=peak)
 
     elif args.binaural_custom:
         carrier, beat = args.binaural_custom
@@ -545,12 +959,19 @@ Examples:
 
         # Add noise if requested
         if args.noise != "none":
-            noise_func = generate_pink_noise if args.noise == "pink" else generate_brown_noise
-            noise = noise_func(args.duration, config.sample_rate)
+            if args.noise == "pink":
+                noise = generate_pink_noise(args.duration, config.sample_rate, args.noise_algo)
+            else:
+                noise = generate_brown_noise(args.duration, config.sample_rate)
             left = (1 - args.noise_level) * left + args.noise_level * noise
             right = (1 - args.noise_level) * right + args.noise_level * noise
 
-        save_wav(None, args.output, config, stereo=True, left=left, right=right)
+        # Peak is only known analytically when no noise is layered in
+        peak = None
+        if args.noise == "none":
+            peak = _analytic_peak_harmonic("warm") if use_harmonics else 1.0
+        save_wav(None, args.output, config, stereo=True, left=left, right=right,
+                 known_peak=peak)
 
     elif args.freq:
         print(f"\nGenerating {args.freq} Hz tone")
@@ -563,12 +984,17 @@ Examples:
 
         # Add noise if requested
         if args.noise != "none":
-            noise_func = generate_pink_noise if args.noise == "pink" else generate_brown_noise
-            noise = noise_func(args.duration, config.sample_rate)
+            if args.noise == "pink":
+                noise = generate_pink_noise(args.duration, config.sample_rate, args.noise_algo)
+            else:
+                noise = generate_brown_noise(args.duration, config.sample_rate)
             audio = (1 - args.noise_level) * audio + args.noise_level * noise
             print(f"  With {args.noise} noise at {args.noise_level*100:.0f}%")
 
-        save_wav(audio, args.output, config)
+        peak = None
+        if args.noise == "none":
+            peak = _analytic_peak_harmonic(args.harmonics) if args.harmonics != "none" else 1.0
+        save_wav(audio, args.output, config, known_peak=peak)
 
     elif args.solfeggio:
         info = SOLFEGGIO[args.solfeggio]
@@ -578,10 +1004,12 @@ Examples:
 
         if args.harmonics != "none":
             audio = generate_with_harmonics(args.solfeggio, args.duration, config.sample_rate, args.harmonics)
+            peak = _analytic_peak_harmonic(args.harmonics)
         else:
             audio = generate_sine(args.solfeggio, args.duration, config.sample_rate)
+            peak = 1.0
 
-        save_wav(audio, args.output, config)
+        save_wav(audio, args.output, config, known_peak=peak)
 
     elif args.isochronic:
         freq, pulse = args.isochronic
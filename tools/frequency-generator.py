@@ -10,14 +10,58 @@ Usage:
 """
 
 import argparse
+import math
 import numpy as np
-import wave
 import struct
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
 from typing import List, Tuple
 
-# Solfeggio frequencies and their properties
-SOLFEGGIO_FREQUENCIES = {
+# Numba is optional - when available, tone synthesis runs as a fused
+# parallel machine-code loop (one streaming pass, no temporaries);
+# otherwise the NumPy paths below are used. First call per kernel pays
+# a one-off JIT compile cost of a second or so.
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+# Optional compiled fast path for the stereo interleave+quantize loop
+# (see tools/_wavio.pyx for build instructions)
+try:
+    from _wavio import interleave_quantize as _interleave_quantize
+    HAVE_WAVIO = True
+except ImportError:
+    HAVE_WAVIO = False
+
+if HAVE_NUMBA:
+    @njit(parallel=True, fastmath=True)
+    def _sine_kernel(frequency, amplitude, sample_rate, out):
+        for i in prange(out.shape[0]):
+            out[i] = amplitude * math.sin(2.0 * math.pi * frequency * (i / sample_rate))
+
+    @njit(parallel=True, fastmath=True)
+    def _binaural_kernel(left_freq, right_freq, amplitude, sample_rate, left, right):
+        # Both channels share the time axis, so one pass fills the pair
+        for i in prange(left.shape[0]):
+            t = i / sample_rate
+            left[i] = amplitude * math.sin(2.0 * math.pi * left_freq * t)
+            right[i] = amplitude * math.sin(2.0 * math.pi * right_freq * t)
+
+    @njit(parallel=True, fastmath=True)
+    def _isochronic_kernel(frequency, pulse_rate, amplitude, sample_rate, out):
+        # Carrier and square pulse gate fused per sample - no
+        # full-length t/carrier/pulse temporaries
+        for i in prange(out.shape[0]):
+            t = i / sample_rate
+            gate = 0.5 + 0.5 * math.copysign(1.0, math.sin(2.0 * math.pi * pulse_rate * t))
+            out[i] = amplitude * math.sin(2.0 * math.pi * frequency * t) * gate
+
+# Solfeggio frequencies and their properties (read-only mapping)
+SOLFEGGIO_FREQUENCIES = MappingProxyType({
     174: "Pain reduction, security",
     285: "Tissue healing, safety",
     396: "Liberation from fear, guilt",
@@ -27,7 +71,7 @@ SOLFEGGIO_FREQUENCIES = {
     741: "Awakening intuition, expression",
     852: "Spiritual order, returning to source",
     963: "Divine consciousness, pineal activation"
-}
+})
 
 # Common healing frequencies
 HEALING_FREQUENCIES = {
@@ -44,6 +88,12 @@ HEALING_FREQUENCIES = {
     "root": 396,        # Root chakra
 }
 
+# One-cycle sine lookup table for DDS synthesis (see
+# generate_sine_wave). 4096 entries with linear interpolation keeps
+# harmonic distortion well below the int16 quantization floor.
+_WAVETABLE_SIZE = 4096
+
+
 # Brainwave frequencies for binaural beats
 BRAINWAVE_STATES = {
     "delta": (0.5, 4),    # Deep sleep, healing
@@ -54,10 +104,51 @@ BRAINWAVE_STATES = {
 }
 
 
+def _time_axis(n: int) -> np.ndarray:
+    """Sample-index axis in float64, ready for in-place phase scaling.
+
+    Deriving phase straight from the sample index folds the rate into
+    a single constant multiply, with none of the endpoint-division
+    rounding linspace(0, duration, n, False) carries.
+    """
+    return np.arange(n, dtype=np.float64)
+
+
+@lru_cache(maxsize=1)
+def _sine_table() -> np.ndarray:
+    """One cycle of sine plus a wrap entry, so interpolation never
+    needs a modulo on the neighbor index."""
+    table = np.sin(2 * np.pi * np.arange(_WAVETABLE_SIZE + 1) / _WAVETABLE_SIZE).astype(np.float32)
+    table.flags.writeable = False
+    return table
+
+
 def generate_sine_wave(frequency: float, duration: float, sample_rate: int = 44100, amplitude: float = 0.5) -> np.ndarray:
-    """Generate a pure sine wave at the specified frequency."""
-    t = np.linspace(0, duration, int(sample_rate * duration), False)
-    wave = amplitude * np.sin(2 * np.pi * frequency * t)
+    """Generate a pure sine wave at the specified frequency.
+
+    Phase accumulates in float64 for accuracy; samples are stored as
+    float32 (half the memory traffic, and the output is quantized to
+    int16 on save anyway).
+    """
+    n = int(sample_rate * duration)
+    wave = np.empty(n, dtype=np.float32)
+    if HAVE_NUMBA:
+        _sine_kernel(frequency, amplitude, sample_rate, wave)
+        return wave
+
+    # Wavetable DDS: one sin() per table entry instead of per sample,
+    # then a linearly-interpolated gather - roughly an order of
+    # magnitude cheaper than evaluating libm sin per element
+    table = _sine_table()
+    phase = _time_axis(n)
+    phase *= _WAVETABLE_SIZE * frequency / sample_rate
+    phase %= _WAVETABLE_SIZE
+    idx = phase.astype(np.int64)
+    frac = np.empty(n, dtype=np.float32)
+    np.subtract(phase, idx, out=frac, casting='unsafe')
+    lo = table[idx]
+    np.add(lo, (table[idx + 1] - lo) * frac, out=wave)
+    wave *= amplitude
     return wave
 
 
@@ -78,6 +169,13 @@ def generate_binaural_beat(base_freq: float, beat_freq: float, duration: float,
     left_freq = base_freq
     right_freq = base_freq + beat_freq
 
+    if HAVE_NUMBA:
+        n = int(sample_rate * duration)
+        left = np.empty(n, dtype=np.float32)
+        right = np.empty(n, dtype=np.float32)
+        _binaural_kernel(left_freq, right_freq, amplitude, sample_rate, left, right)
+        return left, right
+
     left = generate_sine_wave(left_freq, duration, sample_rate, amplitude)
     right = generate_sine_wave(right_freq, duration, sample_rate, amplitude)
 
@@ -90,13 +188,38 @@ def generate_isochronic_tone(frequency: float, pulse_rate: float, duration: floa
     Generate isochronic tones - single tone that pulses on and off.
     Can be used with speakers (doesn't require headphones like binaural).
     """
-    t = np.linspace(0, duration, int(sample_rate * duration), False)
-    carrier = amplitude * np.sin(2 * np.pi * frequency * t)
-
-    # Create pulse envelope
-    pulse = 0.5 * (1 + np.sign(np.sin(2 * np.pi * pulse_rate * t)))
-
-    return carrier * pulse
+    n = int(sample_rate * duration)
+    if HAVE_NUMBA:
+        out = np.empty(n, dtype=np.float32)
+        _isochronic_kernel(frequency, pulse_rate, amplitude, sample_rate, out)
+        return out
+
+    t = _time_axis(n)
+    t /= sample_rate
+
+    carrier = np.empty(n, dtype=np.float32)
+    np.sin((2 * np.pi * frequency) * t, out=carrier)
+    carrier *= amplitude
+
+    # Branchless square gate: the tone is on during the first half of
+    # each pulse period, so a fractional-phase comparison replaces the
+    # sin + sign round-trip entirely
+    t *= pulse_rate
+    t %= 1.0
+    carrier *= t < 0.5
+    return carrier
+
+
+@lru_cache(maxsize=8)
+def _fade_pair(n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Cached linear fade-in/out pair - sequences reuse identical sizes.
+
+    The fade-out is a reversed view of the fade-in, so one read-only
+    array backs both.
+    """
+    fade_in = np.linspace(0, 1, n, dtype=np.float32)
+    fade_in.flags.writeable = False
+    return fade_in, fade_in[::-1]
 
 
 def apply_fade(audio: np.ndarray, fade_duration: float = 2.0, sample_rate: int = 44100) -> np.ndarray:
@@ -106,28 +229,49 @@ def apply_fade(audio: np.ndarray, fade_duration: float = 2.0, sample_rate: int =
     if len(audio) < fade_samples * 2:
         fade_samples = len(audio) // 4
 
-    # Fade in
-    fade_in = np.linspace(0, 1, fade_samples)
+    fade_in, fade_out = _fade_pair(fade_samples)
     audio[:fade_samples] *= fade_in
-
-    # Fade out
-    fade_out = np.linspace(1, 0, fade_samples)
     audio[-fade_samples:] *= fade_out
 
     return audio
 
 
+# Frames per writeframes call - clip, quantize and interleave happen
+# on ~64k-frame chunks, so no full-length int16 copy of the render
+# ever exists
+_CHUNK_FRAMES = 1 << 16
+
+
+def _wav_header(data_len: int, nchannels: int, sample_rate: int) -> bytes:
+    """Build the 44-byte RIFF/fmt/data header for 16-bit PCM.
+
+    Writing the header by hand and appending raw PCM avoids the wave
+    module's per-writeframes bookkeeping and header re-seeks - the
+    total length is known up front, so the sizes are exact on the
+    first write.
+    """
+    byte_rate = sample_rate * nchannels * 2
+    return (b'RIFF' + struct.pack('<I', 36 + data_len) + b'WAVE'
+            + b'fmt ' + struct.pack('<IHHIIHH', 16, 1, nchannels,
+                                    sample_rate, byte_rate, nchannels * 2, 16)
+            + b'data' + struct.pack('<I', data_len))
+
+
 def save_mono_wav(audio: np.ndarray, filename: str, sample_rate: int = 44100):
     """Save mono audio to WAV file."""
     audio = apply_fade(audio, sample_rate=sample_rate)
-    audio = np.clip(audio, -1, 1)
-    audio_int = (audio * 32767).astype(np.int16)
 
-    with wave.open(filename, 'w') as wav_file:
-        wav_file.setnchannels(1)
-        wav_file.setsampwidth(2)
-        wav_file.setframerate(sample_rate)
-        wav_file.writeframes(audio_int.tobytes())
+    with open(filename, 'wb') as f:
+        f.write(_wav_header(2 * len(audio), 1, sample_rate))
+        for start in range(0, len(audio), _CHUNK_FRAMES):
+            # clip returns a private copy, so the scale and round can
+            # run in place - no extra float scratch before the int cast
+            chunk = np.clip(audio[start:start + _CHUNK_FRAMES], -1, 1)
+            chunk *= 32767.0
+            np.rint(chunk, out=chunk)
+            # .data exposes the int16 buffer directly - no extra
+            # full-chunk bytes copy
+            f.write(chunk.astype(np.int16).data)
 
     print(f"Saved: {filename}")
 
@@ -137,35 +281,63 @@ def save_stereo_wav(left: np.ndarray, right: np.ndarray, filename: str, sample_r
     left = apply_fade(left, sample_rate=sample_rate)
     right = apply_fade(right, sample_rate=sample_rate)
 
-    left = np.clip(left, -1, 1)
-    right = np.clip(right, -1, 1)
-
-    left_int = (left * 32767).astype(np.int16)
-    right_int = (right * 32767).astype(np.int16)
-
-    # Interleave left and right channels
-    stereo = np.empty((left_int.size + right_int.size,), dtype=np.int16)
-    stereo[0::2] = left_int
-    stereo[1::2] = right_int
-
-    with wave.open(filename, 'w') as wav_file:
-        wav_file.setnchannels(2)
-        wav_file.setsampwidth(2)
-        wav_file.setframerate(sample_rate)
-        wav_file.writeframes(stereo.tobytes())
+    with open(filename, 'wb') as f:
+        f.write(_wav_header(4 * len(left), 2, sample_rate))
+        fast_path = (HAVE_WAVIO and left.dtype == np.float32
+                     and right.dtype == np.float32)
+        for start in range(0, len(left), _CHUNK_FRAMES):
+            if fast_path:
+                f.write(_interleave_quantize(left[start:start + _CHUNK_FRAMES],
+                                             right[start:start + _CHUNK_FRAMES]))
+                continue
+
+            # clip returns private copies, so scale and round run in
+            # place before the int cast
+            l_chunk = np.clip(left[start:start + _CHUNK_FRAMES], -1, 1)
+            r_chunk = np.clip(right[start:start + _CHUNK_FRAMES], -1, 1)
+            for chunk in (l_chunk, r_chunk):
+                chunk *= 32767.0
+                np.rint(chunk, out=chunk)
+            l_int = l_chunk.astype(np.int16, copy=False)
+            r_int = r_chunk.astype(np.int16, copy=False)
+
+            # Interleave left and right channels - stacking along
+            # axis 1 lands the samples in native WAV frame order in a
+            # single fused copy, instead of two strided writes into a
+            # fresh buffer
+            stereo = np.stack([l_int, r_int], axis=1).ravel()
+            f.write(stereo.data)
 
     print(f"Saved: {filename}")
 
 
 def generate_solfeggio_sequence(duration_per_freq: float = 30, output_dir: str = ".") -> List[str]:
-    """Generate all solfeggio frequencies as separate files."""
-    files = []
+    """Generate all solfeggio frequencies as separate files.
+
+    All nine waveforms come from a single broadcast sin over one
+    shared phase axis - one wide SIMD pass instead of nine
+    independent generator calls.
+    """
+    sample_rate = 44100
+    n = int(sample_rate * duration_per_freq)
+    t = _time_axis(n)
+    t *= 2 * np.pi / sample_rate
+    freqs = np.array(list(SOLFEGGIO_FREQUENCIES), dtype=np.float64)
+    waves = np.empty((len(freqs), n), dtype=np.float32)
+    np.sin(np.multiply.outer(freqs, t), out=waves)
+    waves *= 0.5
+
+    # The writes are I/O-bound and each waveform row is independent,
+    # so the nine files go out concurrently
+    files = [os.path.join(output_dir, f"solfeggio_{freq}hz.wav")
+             for freq in SOLFEGGIO_FREQUENCIES]
+    with ThreadPoolExecutor(max_workers=min(len(files), os.cpu_count() or 1)) as pool:
+        for future in [pool.submit(save_mono_wav, row, filename)
+                       for row, filename in zip(waves, files)]:
+            future.result()
+
     for freq, description in SOLFEGGIO_FREQUENCIES.items():
-        filename = os.path.join(output_dir, f"solfeggio_{freq}hz.wav")
-        audio = generate_sine_wave(freq, duration_per_freq)
-        save_mono_wav(audio, filename)
         print(f"  {freq} Hz - {description}")
-        files.append(filename)
     return files
 
 
@@ -173,11 +345,15 @@ def generate_chakra_meditation(duration_per_chakra: float = 60, output_file: str
     """Generate a full chakra meditation sequence (root to crown)."""
     chakra_sequence = [396, 417, 528, 639, 741, 852, 963]
 
-    full_audio = np.array([])
-    for freq in chakra_sequence:
-        audio = generate_sine_wave(freq, duration_per_chakra)
-        audio = apply_fade(audio, fade_duration=3.0)
-        full_audio = np.concatenate([full_audio, audio])
+    # Preallocate the full track and fill per-chakra slices in place -
+    # a growing np.concatenate accumulator re-copies everything written
+    # so far on each iteration
+    n = int(44100 * duration_per_chakra)
+    full_audio = np.empty(len(chakra_sequence) * n, dtype=np.float32)
+    for i, freq in enumerate(chakra_sequence):
+        segment = full_audio[i * n:(i + 1) * n]
+        segment[:] = generate_sine_wave(freq, duration_per_chakra)
+        apply_fade(segment, fade_duration=3.0)
 
     save_mono_wav(full_audio, output_file)
     total_duration = len(chakra_sequence) * duration_per_chakra
@@ -23,10 +23,37 @@ import numpy as np
 import wave
 import subprocess
 import os
-import tempfile
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Tuple, Optional
 import struct
 
+# Numba is optional - when available, the mix runs as one fused
+# parallel pass that also reduces the peak; otherwise the NumPy path
+# below is used
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+if HAVE_NUMBA:
+    @njit(parallel=True, fastmath=True)
+    def _mix_peak_kernel(music_l, music_r, freq_l, freq_r,
+                         music_amp, freq_amp, out_l, out_r):
+        # Mix both channels and track the running peak in the same
+        # streaming pass - one read and one write per sample instead
+        # of separate mix, abs and max passes
+        peak = 0.0
+        for i in prange(out_l.shape[0]):
+            l = music_amp * music_l[i] + freq_amp * freq_l[i]
+            r = music_amp * music_r[i] + freq_amp * freq_r[i]
+            out_l[i] = l
+            out_r[i] = r
+            peak = max(peak, max(abs(l), abs(r)))
+        return peak
+
 # ============================================================================
 # RESEARCH-BACKED MIXING LEVELS
 # ============================================================================
@@ -63,44 +90,57 @@ MIXING_LEVELS = {
 # OPTIMAL INSTRUMENT PAIRINGS (Research-derived)
 # ============================================================================
 
-INSTRUMENT_RECOMMENDATIONS = {
-    "theta": {
-        "best_instruments": ["singing bowls", "ambient pads", "soft strings", "flute"],
-        "avoid": ["drums", "bass-heavy", "fast tempo"],
-        "tempo_range": "50-70 BPM",
-        "key_suggestion": "D minor, F major (calming)"
-    },
-    "alpha": {
-        "best_instruments": ["acoustic guitar", "piano", "light percussion", "nature sounds"],
-        "avoid": ["distortion", "sudden changes"],
-        "tempo_range": "60-80 BPM",
-        "key_suggestion": "G major, C major (peaceful)"
-    },
-    "delta": {
-        "best_instruments": ["deep drones", "whale sounds", "very slow strings", "rain"],
-        "avoid": ["any sudden sounds", "high frequencies"],
-        "tempo_range": "40-60 BPM or beatless",
-        "key_suggestion": "Low register, minimal harmonic movement"
-    },
-    "gamma": {
-        "best_instruments": ["bright synths", "crystal bowls", "bells", "light electronic"],
-        "avoid": ["muddy sounds", "heavy compression"],
-        "tempo_range": "80-120 BPM",
-        "key_suggestion": "E major, A major (uplifting)"
-    },
-    "432hz": {
-        "best_instruments": ["strings", "piano", "singing bowls", "choir"],
-        "avoid": ["harsh digital sounds"],
-        "tempo_range": "Any",
-        "key_suggestion": "Natural tuning, avoid tritones"
-    },
-    "528hz": {
-        "best_instruments": ["crystal singing bowl", "harp", "soft vocals", "nature"],
-        "avoid": ["dissonance", "aggressive sounds"],
-        "tempo_range": "60-90 BPM",
-        "key_suggestion": "C major (528 Hz = C5 in Solfeggio)"
-    }
-}
+@dataclass(frozen=True, slots=True)
+class Recommendation:
+    """Instrument pairing guidance for one frequency type.
+
+    Immutable with tuple fields - attribute access is cheaper than
+    nested dict lookups and nothing can mutate the table at runtime.
+    """
+    best_instruments: tuple
+    avoid: tuple
+    tempo_range: str
+    key_suggestion: str
+
+
+INSTRUMENT_RECOMMENDATIONS = MappingProxyType({
+    "theta": Recommendation(
+        best_instruments=("singing bowls", "ambient pads", "soft strings", "flute"),
+        avoid=("drums", "bass-heavy", "fast tempo"),
+        tempo_range="50-70 BPM",
+        key_suggestion="D minor, F major (calming)"
+    ),
+    "alpha": Recommendation(
+        best_instruments=("acoustic guitar", "piano", "light percussion", "nature sounds"),
+        avoid=("distortion", "sudden changes"),
+        tempo_range="60-80 BPM",
+        key_suggestion="G major, C major (peaceful)"
+    ),
+    "delta": Recommendation(
+        best_instruments=("deep drones", "whale sounds", "very slow strings", "rain"),
+        avoid=("any sudden sounds", "high frequencies"),
+        tempo_range="40-60 BPM or beatless",
+        key_suggestion="Low register, minimal harmonic movement"
+    ),
+    "gamma": Recommendation(
+        best_instruments=("bright synths", "crystal bowls", "bells", "light electronic"),
+        avoid=("muddy sounds", "heavy compression"),
+        tempo_range="80-120 BPM",
+        key_suggestion="E major, A major (uplifting)"
+    ),
+    "432hz": Recommendation(
+        best_instruments=("strings", "piano", "singing bowls", "choir"),
+        avoid=("harsh digital sounds",),
+        tempo_range="Any",
+        key_suggestion="Natural tuning, avoid tritones"
+    ),
+    "528hz": Recommendation(
+        best_instruments=("crystal singing bowl", "harp", "soft vocals", "nature"),
+        avoid=("dissonance", "aggressive sounds"),
+        tempo_range="60-90 BPM",
+        key_suggestion="C major (528 Hz = C5 in Solfeggio)"
+    ),
+})
 
 # ============================================================================
 # BRAINWAVE PRESETS
@@ -121,24 +161,34 @@ def db_to_amplitude(db: float) -> float:
     return 10 ** (db / 20)
 
 
+# The dB values are fixed table constants, so their linear amplitudes
+# are computed once at import instead of on every mix
+for _level in MIXING_LEVELS.values():
+    _level["music_amp"] = db_to_amplitude(_level["music_db"])
+    _level["freq_amp"] = db_to_amplitude(_level["frequency_db"])
+
+
 def read_audio_file(filepath: str) -> Tuple[np.ndarray, int, int]:
     """
     Read audio file (WAV or MP3) and return numpy array.
     Returns: (audio_data, sample_rate, channels)
     """
-    # Check if file is MP3, convert if necessary
+    # MP3: have ffmpeg decode straight to raw PCM on stdout - no temp
+    # WAV written to disk and read back (this also drops the unsafe
+    # tempfile.mktemp)
     if filepath.lower().endswith('.mp3'):
-        # Convert MP3 to WAV using ffmpeg
-        temp_wav = tempfile.mktemp(suffix='.wav')
         try:
-            subprocess.run([
-                'ffmpeg', '-i', filepath, '-acodec', 'pcm_s16le',
-                '-ar', '48000', '-ac', '2', '-y', temp_wav
+            proc = subprocess.run([
+                'ffmpeg', '-loglevel', 'error', '-i', filepath,
+                '-f', 's16le', '-acodec', 'pcm_s16le',
+                '-ar', '48000', '-ac', '2', '-'
             ], check=True, capture_output=True)
-            filepath = temp_wav
         except subprocess.CalledProcessError as e:
             print(f"Error converting MP3: {e}")
             raise
+        audio = np.frombuffer(proc.stdout, dtype=np.int16).astype(np.float32)
+        audio /= 32768.0
+        return audio.reshape(-1, 2), 48000, 2
 
     with wave.open(filepath, 'r') as wav:
         sample_rate = wav.getframerate()
@@ -152,10 +202,13 @@ def read_audio_file(filepath: str) -> Tuple[np.ndarray, int, int]:
             audio = np.frombuffer(raw, dtype=np.int16).astype(np.float64)
             audio /= 32768.0
         elif sample_width == 3:
-            # 24-bit
-            audio = np.zeros(n_frames * channels, dtype=np.float64)
-            for i in range(n_frames * channels):
-                audio[i] = int.from_bytes(raw[i*3:(i+1)*3], 'little', signed=True)
+            # 24-bit: pad a zero byte on the LSB side of each 3-byte
+            # sample, view as little-endian int32, then shift right to
+            # sign-extend - all vectorized, no per-sample Python loop
+            b = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3)
+            wide = np.zeros((b.shape[0], 4), dtype=np.uint8)
+            wide[:, 1:] = b
+            audio = (wide.view('<i4').reshape(-1) >> 8).astype(np.float64)
             audio /= 8388608.0
         else:
             audio = np.frombuffer(raw, dtype=np.int32).astype(np.float64)
@@ -168,30 +221,69 @@ def read_audio_file(filepath: str) -> Tuple[np.ndarray, int, int]:
         return audio, sample_rate, channels
 
 
+def _time_axis(n: int) -> np.ndarray:
+    """Sample-index axis in float64, ready for in-place phase scaling."""
+    return np.arange(n, dtype=np.float64)
+
+
 def generate_binaural_beat(duration: float, base_freq: float, beat_freq: float,
                            sample_rate: int = 48000) -> Tuple[np.ndarray, np.ndarray]:
-    """Generate binaural beat tones."""
-    t = np.linspace(0, duration, int(sample_rate * duration), False)
-    left = np.sin(2 * np.pi * base_freq * t)
-    right = np.sin(2 * np.pi * (base_freq + beat_freq) * t)
+    """Generate binaural beat tones.
+
+    Phase is accumulated in float64; samples are stored as float32 -
+    half the memory traffic, and the mix is quantized to int16 on save.
+    """
+    n = int(sample_rate * duration)
+    t = _time_axis(n)
+    t *= 2 * np.pi / sample_rate
+    phase = np.empty(n, dtype=np.float64)
+    left = np.empty(n, dtype=np.float32)
+    right = np.empty(n, dtype=np.float32)
+    np.multiply(t, base_freq, out=phase)
+    np.sin(phase, out=left)
+    np.multiply(t, base_freq + beat_freq, out=phase)
+    np.sin(phase, out=right)
     return left, right
 
 
 def generate_pure_tone(duration: float, frequency: float,
                        sample_rate: int = 48000) -> np.ndarray:
     """Generate pure sine wave tone."""
-    t = np.linspace(0, duration, int(sample_rate * duration), False)
-    return np.sin(2 * np.pi * frequency * t)
+    n = int(sample_rate * duration)
+    t = _time_axis(n)
+    t *= 2 * np.pi * frequency / sample_rate
+    tone = np.empty(n, dtype=np.float32)
+    np.sin(t, out=tone)
+    return tone
 
 
 def generate_isochronic_tone(duration: float, frequency: float, pulse_rate: float,
                              sample_rate: int = 48000) -> np.ndarray:
     """Generate isochronic (pulsing) tone."""
-    t = np.linspace(0, duration, int(sample_rate * duration), False)
-    carrier = np.sin(2 * np.pi * frequency * t)
-    # Smooth pulse envelope using raised cosine
-    pulse = 0.5 * (1 + np.cos(2 * np.pi * pulse_rate * t - np.pi))
-    return carrier * pulse
+    n = int(sample_rate * duration)
+    t = _time_axis(n)
+    t *= 2 * np.pi / sample_rate
+    carrier = np.empty(n, dtype=np.float32)
+    np.sin(frequency * t, out=carrier)
+    # Smooth raised-cosine pulse envelope, reusing the time axis as
+    # scratch: cos(x - pi) == -cos(x), so 0.5*(1 + cos(x - pi)) folds
+    # into a single cos plus fused scale and offset
+    t *= pulse_rate
+    np.cos(t, out=t)
+    t *= -0.5
+    t += 0.5
+    carrier *= t
+    return carrier
+
+
+@lru_cache(maxsize=8)
+def _fade_pair(n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Cached linear fade-in/out pair - repeat mixes reuse identical
+    sizes. The fade-out is a reversed view of the fade-in, so one
+    read-only array backs both."""
+    fade_in = np.linspace(0, 1, n, dtype=np.float32)
+    fade_in.flags.writeable = False
+    return fade_in, fade_in[::-1]
 
 
 def apply_crossfade(audio: np.ndarray, fade_duration: float = 2.0,
@@ -202,72 +294,90 @@ def apply_crossfade(audio: np.ndarray, fade_duration: float = 2.0,
     if len(audio) < fade_samples * 2:
         fade_samples = len(audio) // 4
 
+    fade_in, fade_out = _fade_pair(fade_samples)
+
     # Handle both mono and stereo
-    if audio.ndim == 1:
-        fade_in = np.linspace(0, 1, fade_samples)
-        audio[:fade_samples] *= fade_in
-        fade_out = np.linspace(1, 0, fade_samples)
-        audio[-fade_samples:] *= fade_out
-    else:
-        fade_in = np.linspace(0, 1, fade_samples).reshape(-1, 1)
-        audio[:fade_samples] *= fade_in
-        fade_out = np.linspace(1, 0, fade_samples).reshape(-1, 1)
-        audio[-fade_samples:] *= fade_out
+    if audio.ndim == 2:
+        fade_in = fade_in.reshape(-1, 1)
+        fade_out = fade_out.reshape(-1, 1)
+
+    audio[:fade_samples] *= fade_in
+    audio[-fade_samples:] *= fade_out
 
     return audio
 
 
 def mix_audio(music: np.ndarray, frequency_left: np.ndarray, frequency_right: np.ndarray,
-              music_db: float, frequency_db: float) -> np.ndarray:
+              music_amp: float, freq_amp: float) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Mix music with frequency tones at specified dB levels.
-    """
-    music_amp = db_to_amplitude(music_db)
-    freq_amp = db_to_amplitude(frequency_db)
+    Mix music with frequency tones at the given linear amplitudes
+    (see the precomputed music_amp/freq_amp in MIXING_LEVELS).
+
+    Channels stay as separate 1-D arrays (structure-of-arrays) - the
+    mix runs channel-wise with no N x 2 materialization, and the
+    writer interleaves chunk-by-chunk at save time.
 
+    Returns: (left, right)
+    """
     # Ensure same length
     min_len = min(len(music), len(frequency_left))
 
     if music.ndim == 1:
-        # Mono music - make stereo
-        music_stereo = np.column_stack([music[:min_len], music[:min_len]])
+        music_l = music_r = music[:min_len]
     else:
-        music_stereo = music[:min_len]
-
-    freq_stereo = np.column_stack([frequency_left[:min_len], frequency_right[:min_len]])
+        music_l = np.ascontiguousarray(music[:min_len, 0])
+        music_r = np.ascontiguousarray(music[:min_len, 1])
 
     # Mix with levels
-    mixed = (music_stereo * music_amp) + (freq_stereo * freq_amp)
+    if HAVE_NUMBA:
+        mixed_l = np.empty(min_len, dtype=np.float32)
+        mixed_r = np.empty(min_len, dtype=np.float32)
+        max_val = _mix_peak_kernel(music_l, music_r,
+                                   frequency_left[:min_len], frequency_right[:min_len],
+                                   music_amp, freq_amp, mixed_l, mixed_r)
+    else:
+        mixed_l = music_amp * music_l + freq_amp * frequency_left[:min_len]
+        mixed_r = music_amp * music_r + freq_amp * frequency_right[:min_len]
+        max_val = max(np.max(np.abs(mixed_l)), np.max(np.abs(mixed_r)))
 
     # Normalize to prevent clipping
-    max_val = np.max(np.abs(mixed))
     if max_val > 0.99:
-        mixed = mixed * 0.99 / max_val
+        scale = 0.99 / max_val
+        mixed_l *= scale
+        mixed_r *= scale
 
-    return mixed
+    return mixed_l, mixed_r
 
 
-def save_wav(audio: np.ndarray, filepath: str, sample_rate: int = 48000):
-    """Save audio to WAV file (16-bit for compatibility and speed)."""
-    # Ensure stereo
-    if audio.ndim == 1:
-        audio = np.column_stack([audio, audio])
-
-    # Apply final fade
-    audio = apply_crossfade(audio, sample_rate=sample_rate)
+# Frames per writeframes call - clip and quantize happen on
+# ~64k-frame chunks, so no full-length int16 copy of the mix ever
+# exists
+_CHUNK_FRAMES = 1 << 16
 
-    # Clip and convert to 16-bit
-    audio = np.clip(audio, -1, 1)
-    audio_16bit = (audio * 32767).astype(np.int16)
 
-    # Interleave stereo channels
-    interleaved = audio_16bit.flatten()
+def save_wav(left: np.ndarray, right: np.ndarray, filepath: str, sample_rate: int = 48000):
+    """Save stereo audio to WAV file (16-bit for compatibility and speed)."""
+    # Apply final fade
+    left = apply_crossfade(left, sample_rate=sample_rate)
+    right = apply_crossfade(right, sample_rate=sample_rate)
 
     with wave.open(filepath, 'w') as wav:
         wav.setnchannels(2)
         wav.setsampwidth(2)  # 16-bit
         wav.setframerate(sample_rate)
-        wav.writeframes(interleaved.tobytes())
+        for start in range(0, len(left), _CHUNK_FRAMES):
+            # clip returns private copies, so scale and round run in
+            # place before the int cast
+            l_chunk = np.clip(left[start:start + _CHUNK_FRAMES], -1, 1)
+            r_chunk = np.clip(right[start:start + _CHUNK_FRAMES], -1, 1)
+            for chunk in (l_chunk, r_chunk):
+                chunk *= 32767.0
+                np.rint(chunk, out=chunk)
+            stereo = np.stack([l_chunk.astype(np.int16, copy=False),
+                               r_chunk.astype(np.int16, copy=False)], axis=1)
+            # writeframes accepts any bytes-like object, so the int16
+            # buffer goes straight through without a tobytes copy
+            wav.writeframes(stereo.data)
 
     print(f"Saved: {filepath}")
 
@@ -312,10 +422,10 @@ def print_recommendations(frequency_type: str):
     print(f"\n{'='*60}")
     print(f"RECOMMENDATIONS FOR {frequency_type.upper()} FREQUENCY MUSIC")
     print(f"{'='*60}")
-    print(f"\nBest instruments: {', '.join(rec['best_instruments'])}")
-    print(f"Avoid: {', '.join(rec['avoid'])}")
-    print(f"Tempo range: {rec['tempo_range']}")
-    print(f"Key suggestion: {rec['key_suggestion']}")
+    print(f"\nBest instruments: {', '.join(rec.best_instruments)}")
+    print(f"Avoid: {', '.join(rec.avoid)}")
+    print(f"Tempo range: {rec.tempo_range}")
+    print(f"Key suggestion: {rec.key_suggestion}")
 
     print(f"\n--- Suno/Hailuo Prompt ---")
     print(get_suno_prompt_for_frequency(frequency_type))
@@ -435,19 +545,14 @@ Mixing Levels:
     print(f"  Music: {level['music_db']} dB, Frequency: {level['frequency_db']} dB")
     print(f"  {level['description']}")
 
-    # Flatten music if stereo for mixing
-    if music.ndim == 2:
-        music_flat = music[:, 0]  # Use left channel
-    else:
-        music_flat = music
-
-    # Mix
+    # Mix (mix_audio consumes mono or stereo music directly and
+    # returns separate channels)
     print("\nMixing audio...")
-    mixed = mix_audio(music_flat, freq_left, freq_right,
-                      level['music_db'], level['frequency_db'])
+    mixed_left, mixed_right = mix_audio(music, freq_left, freq_right,
+                                        level['music_amp'], level['freq_amp'])
 
     # Save
-    save_wav(mixed, args.output, sample_rate)
+    save_wav(mixed_left, mixed_right, args.output, sample_rate)
     print(f"\nOutput: {args.output}")
     print(f"Duration: {duration/60:.1f} minutes")
 
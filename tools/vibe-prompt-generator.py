@@ -16,55 +16,84 @@ Usage:
     python vibe-prompt-generator.py --custom --bpm 120 --key "D Major" --mood triumphant
 """
 
-import argparse
-import json
 import random
-from typing import Dict, List, Optional, Tuple
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
 from dataclasses import dataclass
 
 # ============================================================================
 # RESEARCH-BACKED STATE LIBRARY
 # ============================================================================
 
-@dataclass
+# Defined before VibeState so __post_init__ can resolve pairings.
+_FREQ_MAP = MappingProxyType({
+    "delta": "2 Hz binaural (deep sleep)",
+    "theta": "6 Hz binaural (meditation)",
+    "alpha": "10 Hz binaural (calm focus)",
+    "beta": "18 Hz binaural (alertness)",
+    "gamma": "40 Hz binaural (peak cognition)"
+})
+
+
+@dataclass(slots=True, frozen=True)
 class VibeState:
     name: str
     description: str
     bpm_range: Tuple[int, int]
     optimal_bpm: int
-    keys: List[str]
+    keys: Tuple[str, ...]
     mode: str  # major, minor, mixed
-    instruments: List[str]
-    avoid_instruments: List[str]
+    instruments: Tuple[str, ...]
+    avoid_instruments: Tuple[str, ...]
     timbre: str  # bright, warm, soft, powerful
     energy: str  # low, medium, high, very high
-    lyric_themes: List[str]
-    affirmations: List[str]
-    music_styles: List[str]
+    lyric_themes: Tuple[str, ...]
+    affirmations: Tuple[str, ...]
+    music_styles: Tuple[str, ...]
     frequency_pairing: Optional[str]  # brainwave state to pair with
-
-
-VIBE_STATES: Dict[str, VibeState] = {
+    # Derived: human-readable binaural pairing, resolved at construction
+    frequency_binaural: Optional[str] = None
+
+    def __post_init__(self):
+        # Intern the vocabulary strings: "D Major", "piano" etc. recur
+        # across states, and interned keys hash/compare by pointer.
+        # object.__setattr__ because the dataclass is frozen.
+        for field in ("keys", "instruments", "avoid_instruments",
+                      "lyric_themes", "affirmations", "music_styles"):
+            interned = tuple(sys.intern(s) for s in getattr(self, field))
+            object.__setattr__(self, field, interned)
+        for field in ("mode", "timbre", "energy"):
+            object.__setattr__(self, field, sys.intern(getattr(self, field)))
+        if self.frequency_pairing is not None:
+            object.__setattr__(self, "frequency_pairing",
+                               sys.intern(self.frequency_pairing))
+            object.__setattr__(self, "frequency_binaural",
+                               _FREQ_MAP.get(self.frequency_pairing))
+
+
+_VIBE_STATES_RAW: Dict[str, VibeState] = {
     # ========== ENERGY STATES ==========
     "morning_energy": VibeState(
         name="Morning Energy",
         description="Energizing wake-up music to start the day with positivity",
         bpm_range=(110, 130),
         optimal_bpm=120,
-        keys=["G Major", "D Major", "A Major"],
+        keys=("G Major", "D Major", "A Major"),
         mode="major",
-        instruments=["acoustic guitar", "piano", "light percussion", "strings"],
-        avoid_instruments=["heavy bass", "distorted guitar", "aggressive drums"],
+        instruments=("acoustic guitar", "piano", "light percussion", "strings"),
+        avoid_instruments=("heavy bass", "distorted guitar", "aggressive drums"),
         timbre="bright",
         energy="medium-high",
-        lyric_themes=["new beginnings", "possibility", "gratitude", "rising sun", "fresh start"],
-        affirmations=[
+        lyric_themes=("new beginnings", "possibility", "gratitude", "rising sun", "fresh start"),
+        affirmations=(
             "Today is full of possibility",
             "I rise with energy and purpose",
             "Every morning is a new beginning",
             "I am ready for whatever comes"
-        ],
-        music_styles=["indie folk", "acoustic pop", "uplifting acoustic", "morning acoustic"],
+        ),
+        music_styles=("indie folk", "acoustic pop", "uplifting acoustic", "morning acoustic"),
         frequency_pairing="alpha"
     ),
 
@@ -73,20 +102,20 @@ VIBE_STATES: Dict[str, VibeState] = {
         description="Peak energy for workouts, challenges, and maximum drive",
         bpm_range=(140, 170),
         optimal_bpm=150,
-        keys=["E Major", "D Major", "B Major"],
+        keys=("E Major", "D Major", "B Major"),
         mode="major",
-        instruments=["driving drums", "synth bass", "power chords", "brass"],
-        avoid_instruments=["soft piano", "acoustic guitar", "ambient pads"],
+        instruments=("driving drums", "synth bass", "power chords", "brass"),
+        avoid_instruments=("soft piano", "acoustic guitar", "ambient pads"),
         timbre="powerful",
         energy="very high",
-        lyric_themes=["power", "unstoppable", "warrior", "victory", "strength"],
-        affirmations=[
+        lyric_themes=("power", "unstoppable", "warrior", "victory", "strength"),
+        affirmations=(
             "I am unstoppable",
             "Nothing can hold me back",
             "I have limitless power within",
             "I push through every barrier"
-        ],
-        music_styles=["electronic", "EDM", "power pop", "workout anthem", "epic"],
+        ),
+        music_styles=("electronic", "EDM", "power pop", "workout anthem", "epic"),
         frequency_pairing="beta"
     ),
 
@@ -95,20 +124,20 @@ VIBE_STATES: Dict[str, VibeState] = {
         description="Optimal exercise music based on sports psychology research",
         bpm_range=(130, 160),
         optimal_bpm=145,  # Research ceiling effect
-        keys=["D Major", "E Major", "G Major"],
+        keys=("D Major", "E Major", "G Major"),
         mode="major",
-        instruments=["driving drums", "synth", "bass", "electronic elements"],
-        avoid_instruments=["ballad piano", "soft strings", "ambient"],
+        instruments=("driving drums", "synth", "bass", "electronic elements"),
+        avoid_instruments=("ballad piano", "soft strings", "ambient"),
         timbre="bright",
         energy="high",
-        lyric_themes=["strength", "endurance", "pushing limits", "victory", "power"],
-        affirmations=[
+        lyric_themes=("strength", "endurance", "pushing limits", "victory", "power"),
+        affirmations=(
             "I am getting stronger",
             "Pain is temporary, glory is forever",
             "I can do one more",
             "My body is powerful"
-        ],
-        music_styles=["workout EDM", "power pop", "hip hop beats", "electronic anthem"],
+        ),
+        music_styles=("workout EDM", "power pop", "hip hop beats", "electronic anthem"),
         frequency_pairing="beta"
     ),
 
@@ -118,15 +147,15 @@ VIBE_STATES: Dict[str, VibeState] = {
         description="Sustained concentration for knowledge work and study",
         bpm_range=(80, 100),
         optimal_bpm=90,
-        keys=["C Major", "G Major", "F Major"],
+        keys=("C Major", "G Major", "F Major"),
         mode="major",
-        instruments=["ambient synth pads", "soft piano", "minimal percussion", "nature sounds"],
-        avoid_instruments=["vocals", "complex drums", "brass", "heavy bass"],
+        instruments=("ambient synth pads", "soft piano", "minimal percussion", "nature sounds"),
+        avoid_instruments=("vocals", "complex drums", "brass", "heavy bass"),
         timbre="warm",
         energy="low-medium",
-        lyric_themes=[],  # Instrumental preferred for focus
-        affirmations=[],
-        music_styles=["lo-fi", "ambient", "study music", "concentration", "minimal"],
+        lyric_themes=(),  # Instrumental preferred for focus
+        affirmations=(),
+        music_styles=("lo-fi", "ambient", "study music", "concentration", "minimal"),
         frequency_pairing="alpha"
     ),
 
@@ -135,20 +164,20 @@ VIBE_STATES: Dict[str, VibeState] = {
         description="Inspiration and creative exploration",
         bpm_range=(90, 115),
         optimal_bpm=100,
-        keys=["A Major", "E Major", "D Major"],
+        keys=("A Major", "E Major", "D Major"),
         mode="major",
-        instruments=["piano", "strings", "light electronic", "acoustic guitar", "bells"],
-        avoid_instruments=["aggressive drums", "distortion", "heavy bass"],
+        instruments=("piano", "strings", "light electronic", "acoustic guitar", "bells"),
+        avoid_instruments=("aggressive drums", "distortion", "heavy bass"),
         timbre="bright",
         energy="medium",
-        lyric_themes=["imagination", "possibility", "creation", "vision", "dreams"],
-        affirmations=[
+        lyric_themes=("imagination", "possibility", "creation", "vision", "dreams"),
+        affirmations=(
             "Ideas flow through me effortlessly",
             "I am a channel for creativity",
             "My imagination knows no bounds",
             "Every creation is a gift"
-        ],
-        music_styles=["cinematic", "inspirational", "neoclassical", "ambient pop"],
+        ),
+        music_styles=("cinematic", "inspirational", "neoclassical", "ambient pop"),
         frequency_pairing="theta"
     ),
 
@@ -158,20 +187,20 @@ VIBE_STATES: Dict[str, VibeState] = {
         description="Stress relief and nervous system regulation",
         bpm_range=(60, 80),
         optimal_bpm=70,
-        keys=["F Major", "C Major", "G Major"],
+        keys=("F Major", "C Major", "G Major"),
         mode="major",
-        instruments=["soft piano", "strings", "ambient pads", "nature sounds", "harp"],
-        avoid_instruments=["drums", "bass", "brass", "electronic"],
+        instruments=("soft piano", "strings", "ambient pads", "nature sounds", "harp"),
+        avoid_instruments=("drums", "bass", "brass", "electronic"),
         timbre="soft",
         energy="low",
-        lyric_themes=["peace", "safety", "letting go", "breath", "stillness"],
-        affirmations=[
+        lyric_themes=("peace", "safety", "letting go", "breath", "stillness"),
+        affirmations=(
             "I release all tension",
             "I am safe and at peace",
             "With every breath I relax deeper",
             "Calm flows through me"
-        ],
-        music_styles=["ambient", "spa", "meditation", "new age", "peaceful piano"],
+        ),
+        music_styles=("ambient", "spa", "meditation", "new age", "peaceful piano"),
         frequency_pairing="alpha"
     ),
 
@@ -180,20 +209,20 @@ VIBE_STATES: Dict[str, VibeState] = {
         description="Deep meditative states and mindfulness",
         bpm_range=(50, 70),
         optimal_bpm=60,
-        keys=["D Minor", "A Minor", "F Major"],
+        keys=("D Minor", "A Minor", "F Major"),
         mode="mixed",
-        instruments=["singing bowls", "ambient drones", "soft pads", "nature sounds", "flute"],
-        avoid_instruments=["drums", "guitar", "bass", "brass"],
+        instruments=("singing bowls", "ambient drones", "soft pads", "nature sounds", "flute"),
+        avoid_instruments=("drums", "guitar", "bass", "brass"),
         timbre="soft",
         energy="very low",
-        lyric_themes=["presence", "breath", "awareness", "stillness", "being"],
-        affirmations=[
+        lyric_themes=("presence", "breath", "awareness", "stillness", "being"),
+        affirmations=(
             "I am present in this moment",
             "I observe without judgment",
             "Peace is my natural state",
             "I am connected to all that is"
-        ],
-        music_styles=["meditation", "ambient", "drone", "tibetan", "zen"],
+        ),
+        music_styles=("meditation", "ambient", "drone", "tibetan", "zen"),
         frequency_pairing="theta"
     ),
 
@@ -202,20 +231,20 @@ VIBE_STATES: Dict[str, VibeState] = {
         description="Wind-down music for restful sleep",
         bpm_range=(40, 60),
         optimal_bpm=50,
-        keys=["D Minor", "A Minor", "F Major"],
+        keys=("D Minor", "A Minor", "F Major"),
         mode="minor",
-        instruments=["very soft piano", "ambient drones", "nature sounds", "minimal strings"],
-        avoid_instruments=["any percussion", "brass", "electronic", "vocals"],
+        instruments=("very soft piano", "ambient drones", "nature sounds", "minimal strings"),
+        avoid_instruments=("any percussion", "brass", "electronic", "vocals"),
         timbre="soft",
         energy="very low",
-        lyric_themes=["rest", "surrender", "dreams", "night", "peace"],
-        affirmations=[
+        lyric_themes=("rest", "surrender", "dreams", "night", "peace"),
+        affirmations=(
             "I surrender to rest",
             "Sleep comes easily to me",
             "I release this day with gratitude",
             "My body knows how to heal"
-        ],
-        music_styles=["sleep ambient", "dark ambient", "drone", "ASMR music"],
+        ),
+        music_styles=("sleep ambient", "dark ambient", "drone", "ASMR music"),
         frequency_pairing="delta"
     ),
 
@@ -225,20 +254,20 @@ VIBE_STATES: Dict[str, VibeState] = {
         description="Build self-assurance and personal power",
         bpm_range=(115, 140),
         optimal_bpm=128,
-        keys=["D Major", "A Major", "E Major"],
+        keys=("D Major", "A Major", "E Major"),
         mode="major",
-        instruments=["piano", "brass", "strings", "drums", "synth"],
-        avoid_instruments=["soft acoustic", "ambient"],
+        instruments=("piano", "brass", "strings", "drums", "synth"),
+        avoid_instruments=("soft acoustic", "ambient"),
         timbre="powerful",
         energy="high",
-        lyric_themes=["power", "self-belief", "capability", "rising", "unstoppable"],
-        affirmations=[
+        lyric_themes=("power", "self-belief", "capability", "rising", "unstoppable"),
+        affirmations=(
             "I am worthy of success",
             "I believe in myself completely",
             "I walk with confidence",
             "My presence is powerful"
-        ],
-        music_styles=["anthemic", "power ballad", "inspirational pop", "epic orchestral"],
+        ),
+        music_styles=("anthemic", "power ballad", "inspirational pop", "epic orchestral"),
         frequency_pairing="beta"
     ),
 
@@ -247,20 +276,20 @@ VIBE_STATES: Dict[str, VibeState] = {
         description="Cultivate appreciation and positive reflection",
         bpm_range=(80, 100),
         optimal_bpm=90,
-        keys=["G Major", "C Major", "F Major"],
+        keys=("G Major", "C Major", "F Major"),
         mode="major",
-        instruments=["acoustic guitar", "piano", "soft strings", "light percussion"],
-        avoid_instruments=["electronic", "heavy drums", "bass"],
+        instruments=("acoustic guitar", "piano", "soft strings", "light percussion"),
+        avoid_instruments=("electronic", "heavy drums", "bass"),
         timbre="warm",
         energy="medium",
-        lyric_themes=["thankfulness", "blessings", "abundance", "appreciation", "love"],
-        affirmations=[
+        lyric_themes=("thankfulness", "blessings", "abundance", "appreciation", "love"),
+        affirmations=(
             "I am grateful for this moment",
             "Abundance flows to me",
             "I appreciate all that I have",
             "My life is full of blessings"
-        ],
-        music_styles=["acoustic folk", "indie folk", "soft pop", "worship"],
+        ),
+        music_styles=("acoustic folk", "indie folk", "soft pop", "worship"),
         frequency_pairing="alpha"
     ),
 
@@ -269,20 +298,20 @@ VIBE_STATES: Dict[str, VibeState] = {
         description="Process and release difficult emotions safely",
         bpm_range=(60, 85),
         optimal_bpm=72,
-        keys=["A Minor", "E Minor", "D Minor"],
+        keys=("A Minor", "E Minor", "D Minor"),
         mode="minor",
-        instruments=["piano", "strings", "cello", "soft vocals"],
-        avoid_instruments=["electronic", "drums", "brass"],
+        instruments=("piano", "strings", "cello", "soft vocals"),
+        avoid_instruments=("electronic", "drums", "brass"),
         timbre="warm",
         energy="low-medium",
-        lyric_themes=["letting go", "feeling", "acceptance", "healing", "tears"],
-        affirmations=[
+        lyric_themes=("letting go", "feeling", "acceptance", "healing", "tears"),
+        affirmations=(
             "It is safe to feel",
             "I release what no longer serves me",
             "My emotions are valid",
             "Healing happens through feeling"
-        ],
-        music_styles=["sad piano", "emotional ballad", "ambient", "cinematic sad"],
+        ),
+        music_styles=("sad piano", "emotional ballad", "ambient", "cinematic sad"),
         frequency_pairing="theta"
     ),
 
@@ -291,20 +320,20 @@ VIBE_STATES: Dict[str, VibeState] = {
         description="Celebrate and amplify happiness",
         bpm_range=(120, 145),
         optimal_bpm=130,
-        keys=["D Major", "G Major", "A Major"],
+        keys=("D Major", "G Major", "A Major"),
         mode="major",
-        instruments=["bright piano", "acoustic guitar", "strings", "light percussion", "claps"],
-        avoid_instruments=["minor sounds", "drones", "heavy bass"],
+        instruments=("bright piano", "acoustic guitar", "strings", "light percussion", "claps"),
+        avoid_instruments=("minor sounds", "drones", "heavy bass"),
         timbre="bright",
         energy="high",
-        lyric_themes=["happiness", "celebration", "freedom", "dancing", "love"],
-        affirmations=[
+        lyric_themes=("happiness", "celebration", "freedom", "dancing", "love"),
+        affirmations=(
             "Joy is my natural state",
             "I celebrate this moment",
             "Happiness flows through me",
             "Life is beautiful"
-        ],
-        music_styles=["uplifting pop", "indie dance", "feel-good", "celebration"],
+        ),
+        music_styles=("uplifting pop", "indie dance", "feel-good", "celebration"),
         frequency_pairing="gamma"
     ),
 
@@ -314,20 +343,20 @@ VIBE_STATES: Dict[str, VibeState] = {
         description="Visualize and attract desired outcomes",
         bpm_range=(90, 110),
         optimal_bpm=100,
-        keys=["E Major", "A Major", "D Major"],
+        keys=("E Major", "A Major", "D Major"),
         mode="major",
-        instruments=["ethereal synths", "strings", "piano", "bells", "soft vocals"],
-        avoid_instruments=["aggressive drums", "distortion"],
+        instruments=("ethereal synths", "strings", "piano", "bells", "soft vocals"),
+        avoid_instruments=("aggressive drums", "distortion"),
         timbre="bright",
         energy="medium",
-        lyric_themes=["dreams", "vision", "attraction", "becoming", "possibility"],
-        affirmations=[
+        lyric_themes=("dreams", "vision", "attraction", "becoming", "possibility"),
+        affirmations=(
             "I am becoming who I'm meant to be",
             "My dreams are manifesting",
             "I attract what I focus on",
             "The universe supports my vision"
-        ],
-        music_styles=["cinematic", "inspirational", "ethereal pop", "new age"],
+        ),
+        music_styles=("cinematic", "inspirational", "ethereal pop", "new age"),
         frequency_pairing="alpha"
     ),
 
@@ -336,20 +365,20 @@ VIBE_STATES: Dict[str, VibeState] = {
         description="Face fears and take bold action",
         bpm_range=(100, 130),
         optimal_bpm=115,
-        keys=["D Major", "G Major", "C Major"],
+        keys=("D Major", "G Major", "C Major"),
         mode="major",
-        instruments=["drums", "strings", "brass", "piano", "choir"],
-        avoid_instruments=["soft ambient", "minimal"],
+        instruments=("drums", "strings", "brass", "piano", "choir"),
+        avoid_instruments=("soft ambient", "minimal"),
         timbre="powerful",
         energy="high",
-        lyric_themes=["bravery", "facing fears", "rising", "warrior", "strength"],
-        affirmations=[
+        lyric_themes=("bravery", "facing fears", "rising", "warrior", "strength"),
+        affirmations=(
             "I face my fears with courage",
             "I am braver than I know",
             "Fear does not control me",
             "I take bold action"
-        ],
-        music_styles=["epic", "cinematic", "orchestral", "heroic"],
+        ),
+        music_styles=("epic", "cinematic", "orchestral", "heroic"),
         frequency_pairing="beta"
     ),
 
@@ -358,24 +387,110 @@ VIBE_STATES: Dict[str, VibeState] = {
         description="Support physical and emotional healing",
         bpm_range=(55, 75),
         optimal_bpm=65,
-        keys=["F Major", "C Major", "G Major"],
+        keys=("F Major", "C Major", "G Major"),
         mode="major",
-        instruments=["singing bowls", "soft piano", "harp", "nature sounds", "strings"],
-        avoid_instruments=["drums", "bass", "electronic", "brass"],
+        instruments=("singing bowls", "soft piano", "harp", "nature sounds", "strings"),
+        avoid_instruments=("drums", "bass", "electronic", "brass"),
         timbre="soft",
         energy="low",
-        lyric_themes=["healing", "wholeness", "restoration", "love", "light"],
-        affirmations=[
+        lyric_themes=("healing", "wholeness", "restoration", "love", "light"),
+        affirmations=(
             "My body knows how to heal",
             "Healing energy flows through me",
             "I am whole and complete",
             "Love heals all wounds"
-        ],
-        music_styles=["healing ambient", "spa", "sound healing", "peaceful"],
+        ),
+        music_styles=("healing ambient", "spa", "sound healing", "peaceful"),
         frequency_pairing="theta"
     ),
 }
 
+# Read-only view: the library never changes after import.
+VIBE_STATES: Mapping[str, VibeState] = MappingProxyType(_VIBE_STATES_RAW)
+
+# Shared lookup tables for the prompt builders. Module-level read-only
+# constants so each call reuses them instead of rebuilding dict literals.
+_TIMBRE_MAP = MappingProxyType({
+    "bright": "bright and uplifting",
+    "warm": "warm and comforting",
+    "soft": "soft and gentle",
+    "powerful": "powerful and driving"
+})
+
+_ENERGY_MAP = MappingProxyType({
+    "very low": "very peaceful, minimal",
+    "low": "calm and relaxed",
+    "low-medium": "gently flowing",
+    "medium": "balanced energy",
+    "medium-high": "building momentum",
+    "high": "energetic and driving",
+    "very high": "explosive energy, intense"
+})
+
+@lru_cache(maxsize=None)
+def _resolve_state(state: VibeState) -> Tuple[str, str]:
+    """Resolve a state's timbre and energy description strings once."""
+    return (_TIMBRE_MAP.get(state.timbre, state.timbre),
+            _ENERGY_MAP.get(state.energy, ""))
+
+
+# Per-state Suno prompt template with the static parts (BPM, timbre,
+# energy, avoid list) resolved once at import; only the random slots
+# remain as format placeholders.
+_SUNO_TEMPLATE: Dict[str, str] = {}
+for _state in VIBE_STATES.values():
+    _timbre_str, _energy_str = _resolve_state(_state)
+    _avoid = (f"no {', '.join(_state.avoid_instruments[:2])}"
+              if _state.avoid_instruments else "")
+    _SUNO_TEMPLATE[_state.name] = ", ".join(filter(None, (
+        "{style}",
+        f"{_state.optimal_bpm} BPM",
+        "{key}",
+        "{instruments}",
+        _timbre_str,
+        _energy_str,
+        _avoid,
+    )))
+del _state, _timbre_str, _energy_str, _avoid
+
+_LYRICS_TEMPLATE = ("Lyrics themes: {themes}\n"
+                    "Core message: {affirmation}\n"
+                    "Tone: {timbre}, {energy} energy\n"
+                    "Style: {style}")
+
+# Every plausible spelling of a state key, resolved once at import so
+# lookup in main() is a single dict probe.
+_ALIAS_TO_STATE: Dict[str, VibeState] = {}
+for _key, _state in VIBE_STATES.items():
+    for _alias in (_key, _state.name, _state.name.lower(),
+                   _key.replace("_", "-"), _key.replace("_", " ")):
+        _ALIAS_TO_STATE[_alias] = _state
+del _key, _state, _alias
+
+_CATEGORIES: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("Energy", ("morning_energy", "high_energy", "workout")),
+    ("Focus", ("deep_focus", "creative_flow")),
+    ("Calm", ("relaxation", "meditation", "sleep")),
+    ("Emotional", ("confidence", "gratitude", "emotional_release", "joy")),
+    ("Goals", ("manifestation", "courage", "healing")),
+)
+
+# --list output never changes after import, so format it once.
+_LIST_STATES_OUTPUT = "\n".join(
+    ["", "=" * 60, "VIBE OS STATE LIBRARY", "=" * 60, ""]
+    + [line
+       for _category, _states in _CATEGORIES
+       for line in [f"\n### {_category.upper()} ###"]
+       + [f"  {_key:20} - {VIBE_STATES[_key].description}" for _key in _states]]
+    + ["", "=" * 60, "", ""]
+)
+
+# Lowercases and maps separators to underscores in one C-level pass,
+# e.g. "Morning Energy" / "morning-energy" -> "morning_energy".
+_NORMALIZE = str.maketrans(
+    {" ": "_", "-": "_", **{c: c.lower() for c in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"}}
+)
+
 # ============================================================================
 # STATE TRANSITIONS (ISO PRINCIPLE)
 # ============================================================================
@@ -422,84 +537,49 @@ STATE_TRANSITIONS = {
 # PROMPT GENERATION
 # ============================================================================
 
-def generate_suno_prompt(state: VibeState, include_lyrics: bool = True) -> str:
+def generate_suno_prompt(state: VibeState, include_lyrics: bool = True,
+                         rng: random.Random = random) -> str:
     """Generate optimized Suno/Hailuo prompt for a state."""
 
     # Select random elements from the state
-    key = random.choice(state.keys)
-    style = random.choice(state.music_styles)
-    instruments = random.sample(state.instruments, min(3, len(state.instruments)))
-
-    # Build the prompt
-    prompt_parts = [
-        f"{style}",
-        f"{state.optimal_bpm} BPM",
-        f"{key}",
-        f"{', '.join(instruments)}",
-    ]
-
-    # Add timbre description
-    timbre_map = {
-        "bright": "bright and uplifting",
-        "warm": "warm and comforting",
-        "soft": "soft and gentle",
-        "powerful": "powerful and driving"
-    }
-    prompt_parts.append(timbre_map.get(state.timbre, state.timbre))
-
-    # Add energy description
-    energy_map = {
-        "very low": "very peaceful, minimal",
-        "low": "calm and relaxed",
-        "low-medium": "gently flowing",
-        "medium": "balanced energy",
-        "medium-high": "building momentum",
-        "high": "energetic and driving",
-        "very high": "explosive energy, intense"
-    }
-    prompt_parts.append(energy_map.get(state.energy, ""))
-
-    # Add avoid instructions
-    if state.avoid_instruments:
-        prompt_parts.append(f"no {', '.join(state.avoid_instruments[:2])}")
+    key = rng.choice(state.keys)
+    style = rng.choice(state.music_styles)
+    instruments = rng.sample(state.instruments, min(3, len(state.instruments)))
 
-    prompt = ", ".join([p for p in prompt_parts if p])
+    # Everything else was resolved into the template at import time
+    return _SUNO_TEMPLATE[state.name].format(
+        style=style, key=key, instruments=", ".join(instruments))
 
-    return prompt
 
-
-def generate_lyrics_prompt(state: VibeState) -> str:
+def generate_lyrics_prompt(state: VibeState,
+                           rng: random.Random = random) -> str:
     """Generate lyrics prompt based on state themes and affirmations."""
 
-    themes = random.sample(state.lyric_themes, min(3, len(state.lyric_themes)))
+    themes = rng.sample(state.lyric_themes, min(3, len(state.lyric_themes)))
 
     if state.affirmations:
-        affirmation = random.choice(state.affirmations)
-        return f"""Lyrics themes: {', '.join(themes)}
-Core message: {affirmation}
-Tone: {state.timbre}, {state.energy} energy
-Style: {random.choice(state.music_styles)}"""
+        return _LYRICS_TEMPLATE.format(
+            themes=", ".join(themes),
+            affirmation=rng.choice(state.affirmations),
+            timbre=state.timbre,
+            energy=state.energy,
+            style=rng.choice(state.music_styles))
     else:
         return f"Instrumental - no lyrics (optimal for {state.name})"
 
 
-def generate_full_prompt(state: VibeState, include_lyrics: bool = True) -> dict:
-    """Generate complete prompt package."""
+@lru_cache(maxsize=256)
+def _build_prompt(state: VibeState, include_lyrics: bool, seed: int) -> dict:
+    """Deterministic prompt build for a given seed (cacheable).
 
-    music_prompt = generate_suno_prompt(state, include_lyrics)
-    lyrics_prompt = generate_lyrics_prompt(state) if include_lyrics else None
+    VibeState is frozen, so it hashes; the same (state, lyrics, seed)
+    triple always yields the same prompt package and repeat calls are
+    dict lookups instead of fresh RNG draws and string builds.
+    """
+    rng = random.Random(seed)
 
-    # Frequency pairing recommendation
-    freq_info = None
-    if state.frequency_pairing:
-        freq_map = {
-            "delta": "2 Hz binaural (deep sleep)",
-            "theta": "6 Hz binaural (meditation)",
-            "alpha": "10 Hz binaural (calm focus)",
-            "beta": "18 Hz binaural (alertness)",
-            "gamma": "40 Hz binaural (peak cognition)"
-        }
-        freq_info = freq_map.get(state.frequency_pairing)
+    music_prompt = generate_suno_prompt(state, include_lyrics, rng)
+    lyrics_prompt = generate_lyrics_prompt(state, rng) if include_lyrics else None
 
     return {
         "state": state.name,
@@ -507,36 +587,135 @@ def generate_full_prompt(state: VibeState, include_lyrics: bool = True) -> dict:
         "music_prompt": music_prompt,
         "lyrics_prompt": lyrics_prompt,
         "bpm": state.optimal_bpm,
-        "key": random.choice(state.keys),
-        "frequency_pairing": freq_info,
+        "key": rng.choice(state.keys),
+        "frequency_pairing": state.frequency_binaural,
         "recommended_duration": "3-10 minutes"
     }
 
 
-def list_states():
-    """List all available states."""
-    print("\n" + "="*60)
-    print("VIBE OS STATE LIBRARY")
-    print("="*60 + "\n")
-
-    categories = {
-        "Energy": ["morning_energy", "high_energy", "workout"],
-        "Focus": ["deep_focus", "creative_flow"],
-        "Calm": ["relaxation", "meditation", "sleep"],
-        "Emotional": ["confidence", "gratitude", "emotional_release", "joy"],
-        "Goals": ["manifestation", "courage", "healing"]
-    }
+def generate_full_prompt(state: VibeState, include_lyrics: bool = True,
+                         seed: Optional[int] = None) -> dict:
+    """Generate complete prompt package.
+
+    Pass a ``seed`` for a reproducible (and cached) prompt; otherwise a
+    fresh seed is drawn so repeated calls still vary.
+    """
+    if seed is None:
+        seed = random.randrange(2**32)
+    return _build_prompt(state, include_lyrics, seed)
+
+
+# Batch index sampler, bound on first generate_many call so numba and
+# numpy stay optional / deferred like the other heavy imports here.
+_sample_indices = None
+
+
+def _init_sample_indices():
+    """Bind _sample_indices to a numba kernel or a NumPy fallback.
+
+    Returns a callable (n_keys, n_styles, n_extra, n_draws) -> int64
+    array of shape (n_draws, 3) with uniform indices per column.
+    """
+    global _sample_indices
+    import numpy as np
+
+    try:
+        from numba import njit, prange
+
+        # Not cache=True: the hyphenated script name breaks numba's
+        # disk cache (same constraint as the other tools).
+        @njit(parallel=True)
+        def _sample_indices_jit(n_keys, n_styles, n_extra, n_draws):
+            out = np.empty((n_draws, 3), dtype=np.int64)
+            for i in prange(n_draws):
+                out[i, 0] = np.random.randint(0, n_keys)
+                out[i, 1] = np.random.randint(0, n_styles)
+                out[i, 2] = np.random.randint(0, n_extra)
+            return out
+
+        _sample_indices = _sample_indices_jit
+    except ImportError:
+        def _sample_indices_np(n_keys, n_styles, n_extra, n_draws):
+            rng = np.random.default_rng()
+            out = np.empty((n_draws, 3), dtype=np.int64)
+            out[:, 0] = rng.integers(0, n_keys, size=n_draws)
+            out[:, 1] = rng.integers(0, n_styles, size=n_draws)
+            out[:, 2] = rng.integers(0, n_extra, size=n_draws)
+            return out
+
+        _sample_indices = _sample_indices_np
+    return _sample_indices
+
+
+def generate_many(state: VibeState, n: int,
+                  include_lyrics: bool = False) -> list:
+    """Generate ``n`` prompt packages for a state in one batch.
+
+    All random draws happen as vectorized NumPy index picks (one C call
+    per slot instead of n Python-level choice/sample calls); only the
+    final string assembly loops in Python. NumPy is imported here so
+    single-prompt CLI use never pays for it.
+    """
+    import numpy as np
+
+    sampler = _sample_indices or _init_sample_indices()
+
+    # Single picks (key, suno style, lyrics style) in one kernel call
+    idx = sampler(len(state.keys), len(state.music_styles),
+                  len(state.music_styles), n)
+    key_idx, style_idx, lyr_style_idx = idx[:, 0], idx[:, 1], idx[:, 2]
+
+    rng = np.random.default_rng()
+    # Sampling without replacement per row: argsort of uniform noise
+    k = min(3, len(state.instruments))
+    instr_idx = rng.random((n, len(state.instruments))).argsort(axis=1)[:, :k]
+    if include_lyrics and state.affirmations:
+        kt = min(3, len(state.lyric_themes))
+        theme_idx = rng.random((n, len(state.lyric_themes))).argsort(axis=1)[:, :kt]
+        affirm_idx = rng.integers(0, len(state.affirmations), size=n)
+
+    template = _SUNO_TEMPLATE[state.name]
+    results = []
+    for i in range(n):
+        music_prompt = template.format(
+            style=state.music_styles[style_idx[i]],
+            key=state.keys[key_idx[i]],
+            instruments=", ".join(state.instruments[j] for j in instr_idx[i]))
+
+        lyrics_prompt = None
+        if include_lyrics:
+            if state.affirmations:
+                lyrics_prompt = _LYRICS_TEMPLATE.format(
+                    themes=", ".join(state.lyric_themes[j] for j in theme_idx[i]),
+                    affirmation=state.affirmations[affirm_idx[i]],
+                    timbre=state.timbre,
+                    energy=state.energy,
+                    style=state.music_styles[lyr_style_idx[i]])
+            else:
+                lyrics_prompt = f"Instrumental - no lyrics (optimal for {state.name})"
+
+        results.append({
+            "state": state.name,
+            "description": state.description,
+            "music_prompt": music_prompt,
+            "lyrics_prompt": lyrics_prompt,
+            "bpm": state.optimal_bpm,
+            "key": state.keys[key_idx[i]],
+            "frequency_pairing": state.frequency_binaural,
+            "recommended_duration": "3-10 minutes"
+        })
+    return results
 
-    for category, states in categories.items():
-        print(f"\n### {category.upper()} ###")
-        for state_key in states:
-            state = VIBE_STATES[state_key]
-            print(f"  {state_key:20} - {state.description}")
 
-    print("\n" + "="*60 + "\n")
+def list_states():
+    """List all available states."""
+    sys.stdout.write(_LIST_STATES_OUTPUT)
 
 
 def main():
+    # Deferred so embedders importing the prompt API never pay for it.
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Vibe Prompt Generator - Research-Backed AI Music Prompts",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -582,17 +761,24 @@ Available States:
         return
 
     if args.state:
-        state_key = args.state.lower().replace(" ", "_").replace("-", "_")
-        if state_key not in VIBE_STATES:
+        state = (_ALIAS_TO_STATE.get(args.state)
+                 or _ALIAS_TO_STATE.get(args.state.translate(_NORMALIZE)))
+        if state is None:
             print(f"Unknown state: {args.state}")
             print("Use --list to see available states")
             return
 
-        state = VIBE_STATES[state_key]
         result = generate_full_prompt(state, args.with_lyrics)
 
         if args.json:
-            print(json.dumps(result, indent=2))
+            try:
+                # Optional C serializer; worthwhile for batch output
+                import orjson
+                sys.stdout.buffer.write(
+                    orjson.dumps(result, option=orjson.OPT_INDENT_2) + b"\n")
+            except ImportError:
+                import json
+                print(json.dumps(result, indent=2))
         else:
             print(f"\n{'='*60}")
             print(f"VIBE: {result['state'].upper()}")